@@ -1,12 +1,28 @@
-from .editor import DocumentEditor
-from .models import DocumentFormattingError, DocumentConfig
-from .parsers import ConfigParser
-from .pipeline import DocumentProcessingPipeline
-
-__all__ = [
-    'DocumentEditor',
-    'DocumentFormattingError',
-    'DocumentConfig',
-    'ConfigParser',
-    'DocumentProcessingPipeline',
-]
+from importlib import import_module
+
+# Экспортируемые имена -> модуль, из которого они импортируются.
+# Импорт выполняется при первом обращении (PEP 562): editor и pipeline
+# тянут docx, docxtpl и docxcompose, которые не нужны, например,
+# при импорте одних только моделей или парсера конфигурации.
+_EXPORTS = {
+    'DocumentEditor': '.editor',
+    'DocumentFormattingError': '.models',
+    'DocumentConfig': '.models',
+    'ConfigParser': '.parsers',
+    'DocumentProcessingPipeline': '.pipeline',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,14 +5,10 @@ from typing import Optional
 from .parsers import ConfigParser
 from .models import DocumentConfig, DocumentFormattingError
 from .pipeline import DocumentProcessingPipeline
+from .utils import save_document
 
-# Настройка локального логгера
+# Обработчики и уровень логирования настраивает приложение (см. main.py, local.py)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter('%(name)s - %(levelname)s - %(message)s'))
-    logger.addHandler(handler)
 
 
 class DocumentEditor:
@@ -110,7 +106,7 @@ class DocumentEditor:
             raise TypeError("output_path must be a string")
 
         try:
-            self.doc.save(output_path)
+            save_document(self.doc, output_path)
             self.logger.info(f"Документ сохранен: {output_path}")
         except Exception as e:
             self.logger.error(f"Ошибка сохранения документа {output_path}: {e}")
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class HeaderTextPart:
     """Часть текста колонтитула с форматированием."""
     text: str
@@ -11,7 +11,7 @@ class HeaderTextPart:
     font_family: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FontConfig:
     """Конфигурация шрифта."""
     family: str
@@ -20,7 +20,7 @@ class FontConfig:
     italic: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MarginsConfig:
     """Конфигурация полей документа."""
     left: str = "20mm"
@@ -29,14 +29,14 @@ class MarginsConfig:
     bottom: str = "20mm"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpacingConfig:
     """Конфигурация межстрочных интервалов."""
     line: float = 1.5
     exceptions: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneralConfig:
     """Основные настройки документа."""
     margins: MarginsConfig
@@ -44,7 +44,7 @@ class GeneralConfig:
     spacing: SpacingConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class TableFormatConfig:
     """Конфигурация форматирования таблиц в титуле."""
     preserve_existing: bool = True
@@ -52,7 +52,7 @@ class TableFormatConfig:
     apply_spacing: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TitlePageConfig:
     """Конфигурация титульного листа."""
     template: str = ""
@@ -67,7 +67,7 @@ class TitlePageConfig:
     table_format: TableFormatConfig = field(default_factory=TableFormatConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class HeadersConfig:
     """Конфигурация колонтитулов."""
     left: str = ""
@@ -78,7 +78,7 @@ class HeadersConfig:
     left_parts: List[HeaderTextPart] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionConfig:
     """Конфигурация нумерации разделов (Фаза 2)."""
     enabled: bool = True
@@ -89,7 +89,7 @@ class SectionConfig:
     numbering_levels: int = 3  # поддержка уровней нумерации
 
 
-@dataclass
+@dataclass(slots=True)
 class TOCConfig:
     """Конфигурация оглавления (Фаза 2)."""
     enabled: bool = False
@@ -98,21 +98,21 @@ class TOCConfig:
     levels: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class PrefaceConfig:
     """Конфигурация предисловия (Фаза 2)."""
     enabled: bool = False
     content: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AppendixConfig:
     """Конфигурация приложений (Фаза 2)."""
     enabled: bool = False
     numbering_style: str = "letters"  # letters (A, Б, В...) или numbers (1, 2, 3...)
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberingConfig:
     """Конфигурация нумерации."""
     headers: HeadersConfig = field(default_factory=HeadersConfig)
@@ -120,7 +120,7 @@ class NumberingConfig:
     sections: SectionConfig = field(default_factory=SectionConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentStructureConfig:
     """Конфигурация структуры документа (Фаза 2)."""
     sections: SectionConfig = field(default_factory=SectionConfig)
@@ -129,7 +129,7 @@ class DocumentStructureConfig:
     appendix: AppendixConfig = field(default_factory=AppendixConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class StructureConfig:
     """Конфигурация структуры документа."""
     title_page: TitlePageConfig = field(default_factory=TitlePageConfig)
@@ -138,7 +138,7 @@ class StructureConfig:
     document_structure: DocumentStructureConfig = field(default_factory=DocumentStructureConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentConfig:
     """Полная конфигурация документа."""
     general: GeneralConfig
@@ -173,17 +173,15 @@ class DocumentConfig:
         numbering_data = structure_data.get('numbering', {})
         headers_data = numbering_data.get('headers', {})
         
-        # Преобразуем right_parts и left_parts в HeaderTextPart если они присутствуют
-        if 'right_parts' in headers_data and isinstance(headers_data['right_parts'], list):
-            headers_data['right_parts'] = [
-                HeaderTextPart(**part) for part in headers_data['right_parts']
-            ]
-        if 'left_parts' in headers_data and isinstance(headers_data['left_parts'], list):
-            headers_data['left_parts'] = [
-                HeaderTextPart(**part) for part in headers_data['left_parts']
-            ]
+        # Преобразуем right_parts и left_parts в HeaderTextPart если они присутствуют.
+        # Исходный словарь не изменяется: те же данные можно разобрать повторно
+        headers_kwargs = dict(headers_data)
+        for parts_key in ('right_parts', 'left_parts'):
+            parts = headers_kwargs.get(parts_key)
+            if isinstance(parts, list):
+                headers_kwargs[parts_key] = [HeaderTextPart(**part) for part in parts]
         
-        headers = HeadersConfig(**headers_data) if headers_data else HeadersConfig()
+        headers = HeadersConfig(**headers_kwargs) if headers_kwargs else HeadersConfig()
         numbering = NumberingConfig(
             headers=headers,
             pages=numbering_data.get('pages')
@@ -1,12 +1,48 @@
+import json
+import os
+import tempfile
 import yaml
 import logging
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from ..models import DocumentConfig, ConfigValidationError, ConfigParsingError
 
 logger = logging.getLogger(__name__)
 
+# C-реализация загрузчика (libyaml), если PyYAML собран с ней
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Чтение JSON-кэша через orjson, если он установлен
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Суффикс JSON-кэша, который сохраняется рядом с YAML конфигурацией
+_JSON_CACHE_SUFFIX = '.cache.json'
+
+# Кэш в памяти процесса: абсолютный путь -> (mtime_ns, размер, JSON-кэш).
+# Хранится строка, а не объект: каждый вызов получает независимую копию данных.
+# Размер ограничен: сервис загружает конфигурации из новых временных каталогов,
+# и без вытеснения кэш рос бы с каждым запросом
+_PAYLOAD_CACHE: 'OrderedDict[str, Tuple[int, int, str]]' = OrderedDict()
+_PAYLOAD_CACHE_SIZE = 32
+
+# Дерево обязательных полей конфигурации (None — лист дерева).
+# Проверяется за один спуск: общие префиксы путей не обходятся повторно
+_REQUIRED_TREE = {
+    'document': {
+        'general': {
+            'margins': None,
+            'fonts': None,
+            'spacing': None,
+        },
+        'structure': None,
+    },
+}
+
 
 class ConfigParser:
     """Парсер конфигурации документа из YAML."""
@@ -27,8 +63,7 @@ class ConfigParser:
             ConfigValidationError: Если валидация не пройдена.
         """
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = ConfigParser._load_yaml(config_path)
             logger.info(f"YAML конфигурация загружена: {config_path}")
         except FileNotFoundError:
             logger.error(f"Файл конфигурации не найден: {config_path}")
@@ -42,6 +77,118 @@ class ConfigParser:
 
         return ConfigParser.from_dict(data)
 
+    @staticmethod
+    def _load_yaml(config_path: str) -> Any:
+        """
+        Загружает YAML, переиспользуя JSON-кэш рядом с файлом конфигурации.
+
+        Кэш хранит размер и mtime исходного файла; пока они совпадают,
+        данные читаются через json без разбора YAML. Повторные загрузки
+        в том же процессе обходятся без чтения файла кэша.
+
+        Args:
+            config_path: Путь к файлу конфигурации.
+
+        Returns:
+            Данные конфигурации.
+        """
+        stat = os.stat(config_path)
+        key = os.path.abspath(config_path)
+
+        memo = _PAYLOAD_CACHE.get(key)
+        if memo is not None and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            _PAYLOAD_CACHE.move_to_end(key)
+            return _json_loads(memo[2])['data']
+
+        cache_path = config_path + _JSON_CACHE_SUFFIX
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                payload = f.read()
+            cached = _json_loads(payload)
+            if cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                logger.debug(f"Конфигурация загружена из кэша: {cache_path}")
+                ConfigParser._remember_payload(key, stat, payload)
+                return cached['data']
+        except (OSError, ValueError, KeyError, TypeError):
+            # Кэша нет или он повреждён — разбираем YAML
+            pass
+
+        # libyaml сам декодирует байты, без промежуточного текстового потока
+        with open(config_path, 'rb') as f:
+            data = yaml.load(f, Loader=_YAML_LOADER)
+
+        payload = ConfigParser._dump_json_cache(stat, data)
+        if payload is not None:
+            ConfigParser._remember_payload(key, stat, payload)
+            ConfigParser._write_json_cache(cache_path, payload)
+        return data
+
+    @staticmethod
+    def _remember_payload(key: str, stat: os.stat_result, payload: str) -> None:
+        """
+        Сохраняет JSON-кэш в памяти, вытесняя давно не использованные записи.
+
+        Args:
+            key: Абсолютный путь к файлу конфигурации.
+            stat: Результат os.stat исходного YAML файла.
+            payload: Содержимое JSON-кэша.
+        """
+        _PAYLOAD_CACHE[key] = (stat.st_mtime_ns, stat.st_size, payload)
+        _PAYLOAD_CACHE.move_to_end(key)
+        while len(_PAYLOAD_CACHE) > _PAYLOAD_CACHE_SIZE:
+            _PAYLOAD_CACHE.popitem(last=False)
+
+    @staticmethod
+    def _dump_json_cache(stat: os.stat_result, data: Any) -> Optional[str]:
+        """
+        Сериализует данные конфигурации в JSON-кэш.
+
+        Args:
+            stat: Результат os.stat исходного YAML файла.
+            data: Данные конфигурации.
+
+        Returns:
+            Содержимое кэша или None, если данные не переживают
+            преобразование в JSON без потерь (даты, нестроковые ключи).
+        """
+        try:
+            payload = json.dumps(
+                {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'data': data},
+                ensure_ascii=False,
+                separators=(',', ':')
+            )
+        except (TypeError, ValueError):
+            return None
+        if json.loads(payload)['data'] != data:
+            return None
+        return payload
+
+    @staticmethod
+    def _write_json_cache(cache_path: str, payload: str) -> None:
+        """
+        Атомарно сохраняет JSON-кэш конфигурации.
+
+        Кэш не пишется, если каталог недоступен для записи.
+
+        Args:
+            cache_path: Путь к файлу кэша.
+            payload: Содержимое кэша.
+        """
+        directory = os.path.dirname(cache_path) or '.'
+        if not os.access(directory, os.W_OK):
+            return
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Не удалось сохранить кэш конфигурации {cache_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> DocumentConfig:
         """
@@ -78,21 +225,32 @@ class ConfigParser:
         Raises:
             ConfigValidationError: Если отсутствуют обязательные поля.
         """
-        required_paths = [
-            ['document', 'general', 'margins'],
-            ['document', 'general', 'fonts'],
-            ['document', 'general', 'spacing'],
-            ['document', 'structure'],
-        ]
-
-        for path in required_paths:
-            current = data
-            path_str = '.'.join(path)
-            
-            for key in path:
-                if not isinstance(current, dict) or key not in current:
-                    logger.error(f"Отсутствует обязательное поле: {path_str}")
-                    raise ConfigValidationError(f"Отсутствует обязательное поле: {path_str}")
-                current = current[key]
-
+        ConfigParser._check_required(data, _REQUIRED_TREE, ())
         logger.debug("Валидация конфигурации пройдена успешно")
+
+    @staticmethod
+    def _check_required(node: Any, spec: Dict[str, Any], path: Tuple[str, ...]) -> None:
+        """
+        Проверяет наличие обязательных ключей на одном уровне дерева и спускается ниже.
+
+        Args:
+            node: Текущий узел конфигурации.
+            spec: Поддерево обязательных полей для этого узла.
+            path: Путь ключей до текущего узла.
+
+        Raises:
+            ConfigValidationError: Если отсутствует обязательное поле.
+        """
+        for key, children in spec.items():
+            key_path = path + (key,)
+            if not isinstance(node, dict) or key not in node:
+                # Сообщаем полный путь до первого обязательного листа
+                while children:
+                    first = next(iter(children))
+                    key_path += (first,)
+                    children = children[first]
+                path_str = '.'.join(key_path)
+                logger.error(f"Отсутствует обязательное поле: {path_str}")
+                raise ConfigValidationError(f"Отсутствует обязательное поле: {path_str}")
+            if children:
+                ConfigParser._check_required(node[key], children, key_path)
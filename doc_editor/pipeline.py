@@ -14,7 +14,6 @@ from .processors import (
 )
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
 
 
 class DocumentProcessingPipeline:
@@ -22,6 +21,8 @@ class DocumentProcessingPipeline:
     Орхестратор обработки документа.
     
     Координирует последовательность применения всех процессоров к документу.
+    Все этапы работают с одним объектом документа в памяти: промежуточные
+    файлы не создаются, на диск документ записывается только в DocumentEditor.save.
     """
 
     def __init__(self, doc: Document, config: DocumentConfig):
@@ -49,8 +50,8 @@ class DocumentProcessingPipeline:
         try:
             self.logger.info("Начало выполнения pipeline обработки документа")
 
-            # Фаза 1: Применение стилей и полей
-            self._apply_styles_and_margins()
+            # Фаза 1: Применение стилей
+            self._apply_styles()
 
             # Фаза 2: Построение структуры (титульный лист)
             if add_title_page:
@@ -64,33 +65,23 @@ class DocumentProcessingPipeline:
             self.logger.error(f"Ошибка выполнения pipeline: {e}")
             raise DocumentFormattingError(f"Ошибка выполнения pipeline: {e}")
 
-    def _apply_styles_and_margins(self) -> None:
-        """Применяет стили и поля к документу."""
-        self.logger.info("Этап 1: Применение стилей и полей")
+    def _apply_styles(self) -> None:
+        """Применяет стили к документу."""
+        self.logger.info("Этап 1: Применение стилей")
 
-        # Применяем стили
+        # Поля выставляются один раз на этапе 3, уже после добавления
+        # титульного листа, чтобы они действовали и на его секции
         style_processor = StyleProcessor(self.doc, self.config)
         style_processor.apply()
 
-        # Применяем поля
-        margins_processor = MarginsProcessor(self.doc, self.config)
-        margins_processor.apply()
-
     def _apply_title_page(self) -> None:
         """Добавляет титульный лист к документу."""
         self.logger.info("Этап 2: Добавление титульного листа")
 
-        # Сохраняем текущий документ
-        temp_path = "temp_with_styles.docx"
-        self.doc.save(temp_path)
-
-        # Добавляем титульный лист
+        # Титул объединяется с документом в памяти: промежуточные файлы
+        # не пишутся, документ сохраняется на диск только один раз
         title_processor = TitleProcessor(self.config)
-        output_with_title = "doc_with_title.docx"
-        title_processor.apply(temp_path, output_with_title)
-
-        # Загружаем документ с титулом
-        self.doc = Document(output_with_title)
+        self.doc = title_processor.add_title_page(self.doc)
 
     def _apply_settings_after_structure(self) -> None:
         """Повторно применяет настройки после изменения структуры документа."""
@@ -9,14 +9,26 @@ AppendixProcessor - Компонент для управления прилож
 """
 
 import logging
-from typing import List, Optional, Tuple
+import re
+from typing import Dict, List, Optional, Tuple
 from docx.document import Document
 from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+from ..utils import paragraph_style_names
+
 logger = logging.getLogger(__name__)
 
+# Ключевые слова заголовков приложений, объединённые в одно регулярное выражение.
+# Поиск подстрочный, поэтому формы вроде "appendix a" и "приложением" покрыты
+_APPENDIX_RE = re.compile(r'appendix|appendices|annex|приложени[еию]', re.IGNORECASE)
+
+# Обозначения приложений по индексу: A..Z, затем AA..ZZ (26 + 26 * 26 значений)
+_LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_APPENDIX_LETTERS = tuple(_LETTERS) + tuple(first + second for first in _LETTERS for second in _LETTERS)
+
 
 class AppendixProcessor:
     """
@@ -87,26 +99,47 @@ class AppendixProcessor:
             List[Tuple[int, str]]: Список кортежей (индекс_параграфа, текст)
         """
         appendix_headings = []
-        appendix_keywords = [
-            'appendix', 'приложение', 'annex', 'приложении',
-            'приложению', 'приложением', 'appendices', 'appendix',
-            'appendix a', 'appendix b', 'приложение а', 'приложение б'
-        ]
-        
-        for idx, paragraph in enumerate(document.paragraphs):
-            # Check if paragraph is a heading
-            if not paragraph.style.name.startswith('Heading'):
+        is_heading, default_is_heading = self._heading_style_map(document)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        
+        # Обходим элементы w:p тела напрямую (те же, что в document.paragraphs),
+        # не создавая объект Paragraph для каждого абзаца
+        for idx, p in enumerate(document.element.body.iterchildren(qn('w:p'))):
+            # Check if paragraph is a heading (по w:pStyle, без поиска стиля для каждого абзаца)
+            if not is_heading.get(p.style, default_is_heading):
                 continue
             
             # Check if contains appendix keywords
-            text_lower = paragraph.text.lower().strip()
+            text = p.text
             
-            if any(keyword in text_lower for keyword in appendix_keywords):
-                appendix_headings.append((idx, paragraph.text))
-                self.logger.debug(f"Найдено приложение: {paragraph.text}")
+            if _APPENDIX_RE.search(text):
+                appendix_headings.append((idx, text))
+                if debug_enabled:
+                    self.logger.debug(f"Найдено приложение: {text}")
         
         return appendix_headings
     
+    @staticmethod
+    def _heading_style_map(document: Document) -> Tuple[Dict[str, bool], bool]:
+        """
+        Построить таблицу стилей абзацев: styleId -> является ли стиль заголовком
+        (см. paragraph_style_names).
+        
+        Args:
+            document: Документ
+        
+        Returns:
+            Tuple[Dict[str, bool], bool]: Таблица стилей и признак заголовка
+            для стиля абзацев по умолчанию
+        """
+        names, default_name = paragraph_style_names(document)
+        is_heading = {
+            style_id: name is not None and name.startswith('Heading')
+            for style_id, name in names.items()
+        }
+        default_is_heading = default_name is not None and default_name.startswith('Heading')
+        return is_heading, default_is_heading
+    
     def _apply_appendix_numbering(self, document: Document, 
                                    appendix_headings: List[Tuple[int, str]]) -> None:
         """
@@ -120,9 +153,12 @@ class AppendixProcessor:
             appendix_headings: Список приложений (индекс, текст)
         """
         numbering_style = self.config.structure.document_structure.appendix.numbering_style
+        # document.paragraphs строит новый список при каждом обращении
+        paragraphs = document.paragraphs
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         
         for app_number, (idx, original_text) in enumerate(appendix_headings):
-            paragraph = document.paragraphs[idx]
+            paragraph = paragraphs[idx]
             
             if numbering_style == "numbers":
                 # Numeric numbering: 1, 2, 3...
@@ -137,8 +173,34 @@ class AppendixProcessor:
                 description = original_text.split(':', 1)[1].strip()
                 new_text = f"{new_text}: {description}"
             
+            self._replace_paragraph_text(paragraph, new_text)
+            if debug_enabled:
+                self.logger.debug(f"Приложение {app_number + 1} обновлено: {new_text}")
+    
+    @staticmethod
+    def _replace_paragraph_text(paragraph, new_text: str) -> None:
+        """
+        Заменить текст параграфа, сохранив первый run и его форматирование.
+        
+        В отличие от присваивания paragraph.text, не удаляет все runs
+        с созданием нового: текст первого run изменяется на месте,
+        остальное содержимое параграфа (кроме w:pPr) удаляется.
+        
+        Args:
+            paragraph: Параграф для обновления
+            new_text: Новый текст
+        """
+        p = paragraph._p
+        runs = p.r_lst
+        if not runs:
             paragraph.text = new_text
-            self.logger.debug(f"Приложение {app_number + 1} обновлено: {new_text}")
+            return
+        
+        first_run = runs[0]
+        for child in list(p):
+            if child is not first_run and child.tag != qn('w:pPr'):
+                p.remove(child)
+        paragraph.runs[0].text = new_text
     
     def _get_appendix_letter(self, index: int) -> str:
         """
@@ -154,18 +216,9 @@ class AppendixProcessor:
         Returns:
             str: Буква для приложения
         """
-        # English letters (A-Z, then AA-AZ, etc.)
-        letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-        
-        if index < len(letters):
-            return letters[index]
-        
-        # For index >= 26, return with double letters
-        first_letter_idx = (index - 26) // 26
-        second_letter_idx = (index - 26) % 26
-        
-        if first_letter_idx < len(letters):
-            return letters[first_letter_idx] + letters[second_letter_idx]
+        # English letters (A-Z, then AA-AZ, etc.) из заранее построенной таблицы
+        if index < len(_APPENDIX_LETTERS):
+            return _APPENDIX_LETTERS[index]
         
         # Fallback for very high indices
         return str(index + 1)
@@ -1,15 +1,42 @@
 import logging
+from copy import deepcopy
 from docx import Document
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.oxml import OxmlElement, parse_xml
-from docx.oxml.ns import qn, nsdecls
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 from docx.shared import Pt
-from typing import Optional, List, Dict, Any
+from docx.text.paragraph import Paragraph
+from typing import List, Dict, Any
 
 from ..models import DocumentConfig, ProcessorError, HeaderTextPart
+from ..utils import set_run_fonts
 
 logger = logging.getLogger(__name__)
 
+# Соответствие строкового выравнивания из конфигурации значениям python-docx
+_ALIGNMENTS = {
+    'left': WD_PARAGRAPH_ALIGNMENT.LEFT,
+    'right': WD_PARAGRAPH_ALIGNMENT.RIGHT,
+    'center': WD_PARAGRAPH_ALIGNMENT.CENTER,
+}
+
+
+def _build_page_field() -> tuple:
+    """Строит элементы поля номера страницы: fldChar begin, instrText PAGE, fldChar end."""
+    fld_char_begin = OxmlElement('w:fldChar')
+    fld_char_begin.set(qn('w:fldCharType'), 'begin')
+
+    instr_text = OxmlElement('w:instrText')
+    instr_text.text = 'PAGE'
+
+    fld_char_end = OxmlElement('w:fldChar')
+    fld_char_end.set(qn('w:fldCharType'), 'end')
+
+    return fld_char_begin, instr_text, fld_char_end
+
+
+# Заготовка поля номера страницы, копируется в каждый футер
+_PAGE_FIELD = _build_page_field()
 
 class HeaderFooterProcessor:
     """Обработчик колонтитулов документа."""
@@ -25,6 +52,9 @@ class HeaderFooterProcessor:
         self.doc = doc
         self.config = config
         self.logger = logger
+        # Основной шрифт нужен всем построителям runs — определяем его один раз
+        main_font = config.general.fonts.get('main')
+        self._main_family = main_font.get('family') if isinstance(main_font, dict) else None
 
     def apply(self) -> None:
         """Применяет настройки колонтитулов из конфигурации."""
@@ -48,6 +78,25 @@ class HeaderFooterProcessor:
         
         self.doc.settings.odd_and_even_pages_header_footer = True
 
+        # Содержимое колонтитулов одинаково для всех секций: runs строятся
+        # один раз, а в каждую секцию копируются готовые элементы.
+        # Нечетные страницы: справа
+        # Используем right_parts если они есть, иначе fallback на left (строка)
+        if headers_config.right_parts:
+            header_runs = self._build_text_parts_runs(headers_config.right_parts)
+        else:
+            header_runs = self._build_text_runs(headers_config.left)
+
+        # Четные страницы: слева
+        # Используем left_parts если они есть, иначе fallback на right (строка)
+        if headers_config.left_parts:
+            even_header_runs = self._build_text_parts_runs(headers_config.left_parts)
+        else:
+            even_header_runs = self._build_text_runs(headers_config.right)
+
+        # Нумерация страниц
+        page_number_runs = self._build_page_number_runs() if headers_config.page_numbers else None
+
         for i, section in enumerate(self.doc.sections):
             section.different_first_page_header_footer = True
 
@@ -55,56 +104,34 @@ class HeaderFooterProcessor:
             self._clear_element(section.first_page_header)
             self._clear_element(section.first_page_footer)
 
-            # Нечетные страницы: справа
-            # Используем right_parts если они есть, иначе fallback на left (строка)
-            if headers_config.right_parts:
-                logger.debug(f"Section {i}: adding right_parts to header")
-                self._add_text_parts_to_element(
-                    section.header,
-                    headers_config.right_parts,
-                    'right'
-                )
-            else:
-                logger.debug(f"Section {i}: adding left string to header")
-                self._add_text_to_element(
-                    section.header,
-                    headers_config.left,
-                    'right'
-                )
-
-            # Четные страницы: слева
-            # Используем left_parts если они есть, иначе fallback на right (строка)
-            if headers_config.left_parts:
-                logger.debug(f"Section {i}: adding left_parts to even header")
-                self._add_text_parts_to_element(
-                    section.even_page_header,
-                    headers_config.left_parts,
-                    'left'
-                )
-            else:
-                logger.debug(f"Section {i}: adding right string to even header")
-                self._add_text_to_element(
-                    section.even_page_header,
-                    headers_config.right,
-                    'left'
-                )
-
-            # Нумерация страниц
-            if headers_config.page_numbers:
-                self._add_page_number(section.footer, 'right')
-                self._add_page_number(section.even_page_footer, 'left')
+            logger.debug("Section %s: adding headers", i)
+            self._fill_element(section.header, header_runs, 'right')
+            self._fill_element(section.even_page_header, even_header_runs, 'left')
+
+            if page_number_runs is not None:
+                self._fill_element(section.footer, page_number_runs, 'right')
+                self._fill_element(section.even_page_footer, page_number_runs, 'left')
 
     def _clear_element(self, element) -> None:
-        """Очищает содержимое колонтитула."""
-        for paragraph in element.paragraphs:
-            paragraph.clear()
-        if not element.paragraphs:
-            element.add_paragraph()
+        """Очищает содержимое колонтитула, оставляя один пустой параграф."""
+        hdr_ftr = element._element
+        # Колонтитул уже состоит из одного пустого w:p — очищать нечего
+        if len(hdr_ftr) == 1 and hdr_ftr[0].tag == qn('w:p') and len(hdr_ftr[0]) == 0:
+            return
+        for child in list(hdr_ftr):
+            hdr_ftr.remove(child)
+        hdr_ftr.add_p()
+
+    @staticmethod
+    def _fill_element(element, runs: List[Any], align: str) -> None:
+        """
+        Заменяет содержимое первого параграфа колонтитула копиями заготовленных runs.
 
-    def _add_text_parts_to_element(self, element, text_parts: List[HeaderTextPart], align: Optional[str] = None) -> None:
-        """Добавляет текст с поддержкой форматирования (жирный, курсив и т.д.)."""
-        logger.debug(f"Adding {len(text_parts)} text parts to element with align={align}")
-        
+        Args:
+            element: Колонтитул (header или footer).
+            runs: Элементы w:r, построенные один раз для всех секций.
+            align: Выравнивание параграфа ('left', 'right', 'center').
+        """
         if element.paragraphs:
             paragraph = element.paragraphs[0]
             paragraph.clear()
@@ -112,131 +139,57 @@ class HeaderFooterProcessor:
             paragraph = element.add_paragraph()
 
         # Устанавливаем выравнивание
-        if align == 'left':
-            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
-        elif align == 'right':
-            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
-        elif align == 'center':
-            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        if align in _ALIGNMENTS:
+            paragraph.alignment = _ALIGNMENTS[align]
+
+        p = paragraph._p
+        for run in runs:
+            p.append(deepcopy(run))
+
+    def _build_text_parts_runs(self, text_parts: List[HeaderTextPart]) -> List[Any]:
+        """Строит runs текста с поддержкой форматирования (жирный, курсив и т.д.)."""
+        logger.debug(f"Building {len(text_parts)} text parts")
+        paragraph = Paragraph(OxmlElement('w:p'), None)
 
         # Добавляем каждую часть с её форматированием
-        main_family = self.config.general.fonts['main'].get('family', 'Arial')
+        main_family = self._main_family or 'Arial'
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         for part in text_parts:
-            logger.debug(f"Adding part: {part.text!r}, bold={part.bold}")
+            if debug_enabled:
+                logger.debug(f"Adding part: {part.text!r}, bold={part.bold}")
             run = paragraph.add_run(part.text)
             
             # Применяем форматирование
             run.bold = part.bold
             run.italic = part.italic
             
-            # Применяем шрифт
-            font_family = part.font_family or main_family
-            run.font.name = font_family
-            
-            # Также установим рFonts на уровне XML для надежности
+            # Применяем шрифт (в том числе rFonts на уровне XML для надежности)
             try:
-                rPr = run._element.find(qn('w:rPr'))
-                if rPr is None:
-                    rPr = parse_xml(f'<w:rPr {nsdecls("w")}></w:rPr>')
-                    run._element.insert(0, rPr)
-                rFonts = rPr.find(qn('w:rFonts'))
-                if rFonts is None:
-                    rFonts = parse_xml(f'<w:rFonts {nsdecls("w")}></w:rFonts>')
-                    rPr.append(rFonts)
-                rFonts.set(qn('w:ascii'), font_family)
-                rFonts.set(qn('w:hAnsi'), font_family)
-                rFonts.set(qn('w:cs'), font_family)
+                set_run_fonts(run._r, part.font_family or main_family)
             except Exception as e:
                 logger.warning(f"Failed to set XML formatting: {e}")
 
-    def _add_text_to_element(self, element, text: str, align: Optional[str] = None) -> None:
-        """Добавляет текст в элемент с указанным выравниванием."""
-        if element.paragraphs:
-            paragraph = element.paragraphs[0]
-            paragraph.clear()
-        else:
-            paragraph = element.add_paragraph()
+        return list(paragraph._p.r_lst)
 
-        # Устанавливаем выравнивание
-        if align == 'left':
-            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
-        elif align == 'right':
-            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
-        elif align == 'center':
-            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-
-        # Добавляем текст и применяем семейство шрифта из конфигурации
+    def _build_text_runs(self, text: str) -> List[Any]:
+        """Строит run с текстом и семейством шрифта из конфигурации."""
+        paragraph = Paragraph(OxmlElement('w:p'), None)
         run = paragraph.add_run(text)
-        try:
-            main_family = self.config.general.fonts['main'].get('family', None)
-            if main_family:
-                run.font.name = main_family
-                # also set run-level rFonts to ensure Word uses the family (override theme)
-                rPr = run._element.find(qn('w:rPr'))
-                if rPr is None:
-                    from docx.oxml import parse_xml
-                    rPr = parse_xml(f'<w:rPr {"" if False else nsdecls("w")}></w:rPr>')
-                    run._element.insert(0, rPr)
-                rFonts = rPr.find(qn('w:rFonts'))
-                if rFonts is None:
-                    from docx.oxml import parse_xml
-                    rFonts = parse_xml(f'<w:rFonts {nsdecls("w")}></w:rFonts>')
-                    rPr.append(rFonts)
-                rFonts.set(qn('w:ascii'), main_family)
-                rFonts.set(qn('w:hAnsi'), main_family)
-                rFonts.set(qn('w:cs'), main_family)
-        except Exception:
-            # not critical — continue on error
-            pass
-
-    def _add_page_number(self, footer, align: str = 'center') -> None:
-        """Добавляет номер страницы в футер."""
-        if footer.paragraphs:
-            paragraph = footer.paragraphs[0]
-            paragraph.clear()
-        else:
-            paragraph = footer.add_paragraph()
+        if self._main_family:
+            # also set run-level rFonts to ensure Word uses the family (override theme)
+            set_run_fonts(run._r, self._main_family)
 
-        # Устанавливаем выравнивание
-        if align == 'left':
-            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
-        elif align == 'right':
-            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
-        else:
-            paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        return list(paragraph._p.r_lst)
 
-        # Добавляем поле номера страницы
+    def _build_page_number_runs(self) -> List[Any]:
+        """Строит run с полем номера страницы."""
+        paragraph = Paragraph(OxmlElement('w:p'), None)
         run = paragraph.add_run()
-        fld_char_begin = OxmlElement('w:fldChar')
-        fld_char_begin.set(qn('w:fldCharType'), 'begin')
-
-        instr_text = OxmlElement('w:instrText')
-        instr_text.text = 'PAGE'
-
-        fld_char_end = OxmlElement('w:fldChar')
-        fld_char_end.set(qn('w:fldCharType'), 'end')
-
-        run._element.append(fld_char_begin)
-        run._element.append(instr_text)
-        run._element.append(fld_char_end)
+        for field_element in _PAGE_FIELD:
+            run._element.append(deepcopy(field_element))
         # Применим основной шрифт к полю номера страницы, если задан
-        try:
-            main_family = self.config.general.fonts['main'].get('family', None)
-            if main_family:
-                run.font.name = main_family
-                rPr = run._element.find(qn('w:rPr'))
-                if rPr is None:
-                    from docx.oxml import parse_xml
-                    rPr = parse_xml(f'<w:rPr {nsdecls("w")}></w:rPr>')
-                    run._element.insert(0, rPr)
-                rFonts = rPr.find(qn('w:rFonts'))
-                if rFonts is None:
-                    from docx.oxml import parse_xml
-                    rFonts = parse_xml(f'<w:rFonts {nsdecls("w")}></w:rFonts>')
-                    rPr.append(rFonts)
-                rFonts.set(qn('w:ascii'), main_family)
-                rFonts.set(qn('w:hAnsi'), main_family)
-                rFonts.set(qn('w:cs'), main_family)
-        except Exception:
-            pass
+        if self._main_family:
+            set_run_fonts(run._r, self._main_family)
+
+        return list(paragraph._p.r_lst)
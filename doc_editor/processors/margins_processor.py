@@ -28,19 +28,32 @@ class MarginsProcessor:
             self.logger.info("Начало применения полей документа")
             margins_config = self.config.general.margins
 
-            for i, section in enumerate(self.doc.sections):
-                section.left_margin = parse_measurement(margins_config.left)
-                section.right_margin = parse_measurement(margins_config.right)
-                section.top_margin = parse_measurement(margins_config.top)
-                section.bottom_margin = parse_measurement(margins_config.bottom)
-
-                self.logger.debug(
-                    f"Поля установлены для секции {i + 1}: "
-                    f"левое={margins_config.left}, правое={margins_config.right}, "
-                    f"верхнее={margins_config.top}, нижнее={margins_config.bottom}"
-                )
-
-            self.logger.info(f"Поля успешно применены к {len(self.doc.sections)} секциям")
+            # Значения одинаковы для всех секций — разбираем их один раз
+            left = parse_measurement(margins_config.left)
+            right = parse_measurement(margins_config.right)
+            top = parse_measurement(margins_config.top)
+            bottom = parse_measurement(margins_config.bottom)
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
+            sections = self.doc.sections
+            for i, section in enumerate(sections):
+                # Сеттеры section.*_margin ищут w:pgMar заново при каждом вызове;
+                # находим элемент один раз и пишем все четыре поля в него.
+                # Атрибуты CT_PageMar сами переводят Length в twips.
+                pg_mar = section._sectPr.get_or_add_pgMar()
+                pg_mar.left = left
+                pg_mar.right = right
+                pg_mar.top = top
+                pg_mar.bottom = bottom
+
+                if debug_enabled:
+                    self.logger.debug(
+                        f"Поля установлены для секции {i + 1}: "
+                        f"левое={margins_config.left}, правое={margins_config.right}, "
+                        f"верхнее={margins_config.top}, нижнее={margins_config.bottom}"
+                    )
+
+            self.logger.info(f"Поля успешно применены к {len(sections)} секциям")
         except Exception as e:
             self.logger.error(f"Ошибка применения полей: {e}")
             raise ProcessorError(f"Ошибка применения полей: {e}")
@@ -11,6 +11,9 @@ PrefaceProcessor - Компонент для добавления предисл
 import logging
 from typing import Optional
 from docx.document import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 
 logger = logging.getLogger(__name__)
 
@@ -75,7 +78,7 @@ class PrefaceProcessor:
         Вставить содержание предисловия в документ.
         
         Вставляет предисловие в начало документа (или после существующего содержимого),
-        разбивая содержание на параграфы по переносам строк.
+        разбивая содержание на параграфы по переносам строк (в исходном порядке).
         
         Args:
             document: Документ для вставки
@@ -84,32 +87,33 @@ class PrefaceProcessor:
         Returns:
             None
         """
-        if not document.paragraphs:
-            self.logger.debug("Документ пуст, добавляю предисловие в начало")
-            insert_index = 0
+        body = document.element.body
+        # Вставить перед первым параграфом; в документе без параграфов —
+        # в конец тела (перед w:sectPr), как document.add_paragraph
+        first_paragraph = next(body.iterchildren(qn('w:p')), None)
+        if first_paragraph is not None:
+            insert_index = body.index(first_paragraph)
         else:
-            # Вставить перед первым параграфом
-            insert_index = 0
+            self.logger.debug("Документ пуст, добавляю предисловие в начало")
+            sect_pr = body.sectPr
+            insert_index = body.index(sect_pr) if sect_pr is not None else len(body)
         
-        # Разбить содержание на строки
-        preface_lines = content.split('\n')
+        # Стиль Normal одинаков для всех строк — ищем его один раз
+        style_id = document.part.get_style_id('Normal', WD_STYLE_TYPE.PARAGRAPH)
         
-        # Вставить содержание предисловия
-        for i, line in enumerate(preface_lines):
-            line = line.strip()
-            
-            if not line:
-                # Пустая строка - пропустить
-                continue
-            
-            # Вставить параграф
-            if document.paragraphs and insert_index < len(document.paragraphs):
-                preface_para = document.paragraphs[insert_index].insert_paragraph_before(line)
-            else:
-                preface_para = document.add_paragraph(line)
-            
-            # Установить стиль (Normal)
-            preface_para.style = 'Normal'
+        # Разбить содержание на непустые строки (splitlines учитывает и \r\n)
+        preface_lines = [line for line in map(str.strip, content.splitlines()) if line]
+        
+        # Собрать параграфы предисловия и вставить их одной операцией,
+        # без повторного построения document.paragraphs для каждой строки
+        new_paragraphs = []
+        for line in preface_lines:
+            p = OxmlElement('w:p')
+            p.style = style_id
+            p.add_r().text = line
+            new_paragraphs.append(p)
+        
+        body[insert_index:insert_index] = new_paragraphs
         
         self.logger.debug(f"Вставлено {len(preface_lines)} строк предисловия")
     
@@ -4,11 +4,13 @@ SectionProcessor - Компонент для многоуровневой нум
 """
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from docx.document import Document
 from docx.text.paragraph import Paragraph
 from docx.oxml.ns import qn
 
+from ..utils import paragraph_style_names
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,30 +51,51 @@ class SectionProcessor:
         self.reset_numbering()
         
         processed_count = 0
-        for paragraph in document.paragraphs:
-            style_name = paragraph.style.name
+        levels, default_level = self._heading_level_map(document)
+        body = document._body
+        
+        # Обходим элементы w:p тела напрямую (те же, что в document.paragraphs);
+        # объект Paragraph создаётся только для заголовков
+        for p in document.element.body.iterchildren(qn('w:p')):
+            level = levels.get(p.style, default_level)
             
             # Проверяем, является ли это заголовком
-            if style_name not in self.HEADING_LEVELS:
+            if level is None:
                 continue
             
-            level = self.HEADING_LEVELS[style_name]
-            self._process_heading(paragraph, level)
+            # Текст собирается из runs при каждом обращении — читаем его один раз
+            self._process_heading(Paragraph(p, body), level, p.text.strip())
             processed_count += 1
         
         self.logger.info(f"Обработано {processed_count} заголовков с нумерацией")
     
-    def _process_heading(self, paragraph: Paragraph, level: int) -> None:
+    def _heading_level_map(self, document: Document) -> Tuple[Dict[str, int], Optional[int]]:
+        """
+        Построить таблицу стилей абзацев: styleId -> уровень заголовка.
+        
+        Имена стилей разрешаются один раз на документ, а не для каждого абзаца
+        (см. paragraph_style_names).
+        
+        Args:
+            document: Документ Word
+        
+        Returns:
+            Таблица уровней (None для стилей, не являющихся заголовками) и уровень
+            стиля абзацев по умолчанию (None, если это не заголовок)
+        """
+        names, default_name = paragraph_style_names(document)
+        levels = {style_id: self.HEADING_LEVELS.get(name) for style_id, name in names.items()}
+        return levels, self.HEADING_LEVELS.get(default_name)
+    
+    def _process_heading(self, paragraph: Paragraph, level: int, current_text: str) -> None:
         """
         Обработать один заголовок: обновить номер раздела.
         
         Args:
             paragraph: Абзац с заголовком
             level: Уровень заголовка (0, 1, 2)
+            current_text: Текст заголовка без начальных и конечных пробелов
         """
-        # Сохраняем текущий текст
-        current_text = paragraph.text.strip()
-        
         # Проверяем, не начинается ли уже с цифры (уже нумерован)
         if current_text and current_text[0].isdigit():
             # Парсим существующий номер и обновляем счетчики
@@ -85,9 +108,11 @@ class SectionProcessor:
         # Получаем отформатированный номер
         section_num = self._get_section_number(level)
         
-        # Очищаем параграф
-        for run in paragraph.runs:
-            run.clear()
+        # Очищаем параграф: удаляем прежние runs целиком, а не оставляем
+        # пустые w:r (только прямые потомки w:p, как paragraph.runs)
+        p = paragraph._p
+        for r in p.r_lst:
+            p.remove(r)
         
         # Добавляем номер раздела
         num_run = paragraph.add_run(f"{section_num} ")
@@ -97,7 +122,7 @@ class SectionProcessor:
         text_run = paragraph.add_run(current_text)
         text_run.bold = True
         
-        self.logger.debug(f"Добавлена нумерация '{section_num}' к заголовку")
+        self.logger.debug("Добавлена нумерация '%s' к заголовку", section_num)
     
     def _update_section_number(self, level: int) -> None:
         """
@@ -125,8 +150,7 @@ class SectionProcessor:
         Returns:
             Строка с номером раздела
         """
-        numbers = self.section_numbers[:level + 1]
-        return ".".join(str(n) for n in numbers)
+        return ".".join(map(str, self.section_numbers[:level + 1]))
     
     def _parse_and_update_from_existing(self, text: str, level: int) -> None:
         """
@@ -1,11 +1,10 @@
 import logging
 from docx import Document
-from docx.shared import Pt
+from docx.shared import Emu, Pt, Twips
 from docx.enum.style import WD_STYLE_TYPE
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
+from docx.enum.text import WD_LINE_SPACING, WD_PARAGRAPH_ALIGNMENT
+from docx.oxml import OxmlElement
 from docx.oxml.shared import qn
-from docx.oxml.ns import nsdecls
-from docx.oxml.parser import parse_xml
 from typing import Dict, Any
 
 from ..models import DocumentConfig, ProcessorError
@@ -13,10 +12,44 @@ from ..utils import parse_size
 
 logger = logging.getLogger(__name__)
 
+# Ключи настроек шрифта, которые записываются в w:rPr стиля
+_FONT_KEYS = ('family', 'size', 'bold', 'italic')
+
+# Полные имена тегов и атрибутов, используемые сеттерами шрифта
+_QN_VAL = qn('w:val')
+_QN_B = qn('w:b')
+_QN_BCS = qn('w:bCs')
+_QN_I = qn('w:i')
+_QN_ICS = qn('w:iCs')
+_QN_ASCII = qn('w:ascii')
+_QN_HANSI = qn('w:hAnsi')
+_RFONTS_ATTRS = (_QN_ASCII, _QN_HANSI, qn('w:cs'))
+
+
+def _get_or_add_child(parent, tag: str):
+    """
+    Возвращает дочерний элемент с тегом tag (например, 'w:rPr'),
+    при отсутствии создаёт его в конце parent.
+
+    Элемент строится напрямую, без разбора XML-фрагмента через parse_xml.
+    """
+    child = parent.find(qn(tag))
+    if child is None:
+        child = OxmlElement(tag)
+        parent.append(child)
+    return child
+
 
 class StyleProcessor:
     """Обработчик стилей документа."""
 
+    # Специальные стили: имя -> (размер шрифта, выравнивание).
+    # Стиль для элементов титульной страницы и стиль для колонтитулов
+    SPECIAL_STYLES = {
+        'Custom_Title': (Pt(14), WD_PARAGRAPH_ALIGNMENT.CENTER),
+        'Custom_Header': (Pt(10), WD_PARAGRAPH_ALIGNMENT.RIGHT),
+    }
+
     def __init__(self, doc: Document, config: DocumentConfig):
         """
         Инициализация процессора стилей.
@@ -102,35 +135,32 @@ class StyleProcessor:
         """Настройка специальных стилей."""
         main_font_family = self.config.general.fonts['main'].get('family', 'Arial')
 
-        # Стиль для элементов титульной страницы
-        title_style = self._get_or_create_style(
-            style_name='Custom_Title',
-            style_type=WD_STYLE_TYPE.PARAGRAPH,
-            base_style='Normal'
-        )
-        title_style.font.name = main_font_family
-        title_style.font.size = Pt(14)
-        title_style.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-
-        # Стиль для колонтитулов
-        header_style = self._get_or_create_style(
-            style_name='Custom_Header',
-            style_type=WD_STYLE_TYPE.PARAGRAPH,
-            base_style='Normal'
-        )
-        header_style.font.name = main_font_family
-        header_style.font.size = Pt(10)
-        header_style.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.RIGHT
+        for style_name, (size, alignment) in self.SPECIAL_STYLES.items():
+            style = self._get_or_create_style(
+                style_name=style_name,
+                style_type=WD_STYLE_TYPE.PARAGRAPH,
+                base_style='Normal'
+            )
+            style.font.name = main_font_family
+            style.font.size = size
+            style.paragraph_format.alignment = alignment
 
     def _apply_line_spacing(self) -> None:
         """Применение межстрочных интервалов."""
         spacing_cfg = self.config.general.spacing
         line_spacing = float(spacing_cfg.line)
 
-        # Применяем ко всем стилям параграфов
-        for style in self.doc.styles:
-            if style.type == WD_STYLE_TYPE.PARAGRAPH:
-                style.paragraph_format.line_spacing = line_spacing
+        # Применяем ко всем стилям параграфов: значение w:spacing одинаково
+        # для всех стилей, поэтому вычисляем его один раз и пишем прямо в w:pPr
+        # элементов w:style, без обёрток Style и ParagraphFormat
+        # (то же, что paragraph_format.line_spacing = line_spacing)
+        line = Emu(line_spacing * Twips(240))
+        for style_elm in self.doc.styles.element.style_lst:
+            # Стиль без w:type по умолчанию (OOXML) является стилем параграфа
+            if style_elm.type in (WD_STYLE_TYPE.PARAGRAPH, None):
+                pPr = style_elm.get_or_add_pPr()
+                pPr.spacing_line = line
+                pPr.spacing_lineRule = WD_LINE_SPACING.MULTIPLE
 
         # Обработка исключений
         if spacing_cfg.exceptions:
@@ -147,10 +177,20 @@ class StyleProcessor:
         """Применяет стили ко всем существующим параграфам документа."""
         main_font_family = self.config.general.fonts['main'].get('family', 'Arial')
 
-        for paragraph in self.doc.paragraphs:
-            # Принудительное применение шрифта
-            for run in paragraph.runs:
-                run.font.name = main_font_family
+        # Принудительное применение шрифта: runs параграфов тела (те же, что
+        # paragraph.runs для document.paragraphs) собираются одним XPath-запросом,
+        # без создания объектов Paragraph, Run и Font
+        for r in self.doc.element.body.xpath('./w:p/w:r'):
+            rPr = r.rPr
+            rFonts = rPr.rFonts if rPr is not None else None
+            if rFonts is None:
+                rFonts = r.get_or_add_rPr().get_or_add_rFonts()
+            elif (rFonts.get(_QN_ASCII) == main_font_family
+                  and rFonts.get(_QN_HANSI) == main_font_family):
+                # Шрифт уже установлен (например, при повторном форматировании)
+                continue
+            rFonts.ascii = main_font_family
+            rFonts.hAnsi = main_font_family
 
     def _get_or_create_style(self, style_name: str, style_type: int, base_style: str = None):
         """Получает или создает стиль с указанными параметрами."""
@@ -164,127 +204,72 @@ class StyleProcessor:
 
     def _apply_font_settings(self, style, font_cfg: Dict[str, Any]) -> None:
         """Применяет настройки шрифта к стилю."""
+        if style.type != WD_STYLE_TYPE.PARAGRAPH:
+            if 'family' in font_cfg:
+                style.font.name = font_cfg['family']
+            if 'size' in font_cfg:
+                style.font.size = Pt(parse_size(font_cfg['size']))
+            if 'bold' in font_cfg:
+                style.font.bold = font_cfg['bold']
+            if 'italic' in font_cfg:
+                style.font.italic = font_cfg['italic']
+            return
+
+        if not any(key in font_cfg for key in _FONT_KEYS):
+            return
+
+        # w:pPr и w:rPr стиля находятся (или создаются) один раз для всех настроек
+        rPr = _get_or_add_child(style.element.get_or_add_pPr(), 'w:rPr')
+
         if 'family' in font_cfg:
-            self._set_font_family(style, font_cfg['family'])
+            self._set_font_family(rPr, font_cfg['family'])
 
         if 'size' in font_cfg:
             size_pt = parse_size(font_cfg['size'])
-            self._set_font_size(style, size_pt)
+            self._set_font_size(rPr, size_pt)
 
         if 'bold' in font_cfg:
-            self._set_font_bold(style, font_cfg['bold'])
+            self._set_font_bold(rPr, font_cfg['bold'])
 
         if 'italic' in font_cfg:
-            self._set_font_italic(style, font_cfg['italic'])
-
-    def _set_font_family(self, style, family: str) -> None:
-        """Устанавливает семейство шрифта."""
-        if style.type == WD_STYLE_TYPE.PARAGRAPH:
-            pPr = style.element.get_or_add_pPr()
-            rPr = pPr.find(qn('w:rPr'))
-            if rPr is None:
-                rPr_xml = f'<w:rPr {nsdecls("w")}></w:rPr>'
-                rPr = parse_xml(rPr_xml)
-                pPr.append(rPr)
-
-            rFonts = rPr.find(qn('w:rFonts'))
-            if rFonts is None:
-                rFonts_xml = f'<w:rFonts {nsdecls("w")}></w:rFonts>'
-                rFonts = parse_xml(rFonts_xml)
-                rPr.append(rFonts)
-
-            rFonts.set(qn('w:ascii'), family)
-            rFonts.set(qn('w:hAnsi'), family)
-            rFonts.set(qn('w:cs'), family)
-        else:
-            style.font.name = family
-
-    def _set_font_size(self, style, size_pt: float) -> None:
-        """Устанавливает размер шрифта."""
-        if style.type == WD_STYLE_TYPE.PARAGRAPH:
-            pPr = style.element.get_or_add_pPr()
-            rPr = pPr.find(qn('w:rPr'))
-            if rPr is None:
-                rPr_xml = f'<w:rPr {nsdecls("w")}></w:rPr>'
-                rPr = parse_xml(rPr_xml)
-                pPr.append(rPr)
-
-            # Размер шрифта
-            sz_elem = rPr.find(qn('w:sz'))
-            if sz_elem is None:
-                sz_xml = f'<w:sz {nsdecls("w")} w:val="{int(size_pt * 2)}"/>'
-                sz_elem = parse_xml(sz_xml)
-                rPr.append(sz_elem)
-            else:
-                sz_elem.set(qn('w:val'), str(int(size_pt * 2)))
-
-            # Размер для комплексных скриптов
-            szCs_elem = rPr.find(qn('w:szCs'))
-            if szCs_elem is None:
-                szCs_xml = f'<w:szCs {nsdecls("w")} w:val="{int(size_pt * 2)}"/>'
-                szCs_elem = parse_xml(szCs_xml)
-                rPr.append(szCs_elem)
-            else:
-                szCs_elem.set(qn('w:val'), str(int(size_pt * 2)))
-        else:
-            style.font.size = Pt(size_pt)
-
-    def _set_font_bold(self, style, is_bold: bool) -> None:
-        """Устанавливает жирность шрифта."""
-        if style.type == WD_STYLE_TYPE.PARAGRAPH:
-            pPr = style.element.get_or_add_pPr()
-            rPr = pPr.find(qn('w:rPr'))
-            if rPr is None:
-                rPr_xml = f'<w:rPr {nsdecls("w")}></w:rPr>'
-                rPr = parse_xml(rPr_xml)
-                pPr.append(rPr)
-
-            if is_bold:
-                b_elem = rPr.find(qn('w:b'))
-                if b_elem is None:
-                    b_xml = f'<w:b {nsdecls("w")}/>'
-                    b_elem = parse_xml(b_xml)
-                    rPr.append(b_elem)
-
-                bCs_elem = rPr.find(qn('w:bCs'))
-                if bCs_elem is None:
-                    bCs_xml = f'<w:bCs {nsdecls("w")}/>'
-                    bCs_elem = parse_xml(bCs_xml)
-                    rPr.append(bCs_elem)
-            else:
-                for elem in rPr.findall(qn('w:b')):
-                    rPr.remove(elem)
-                for elem in rPr.findall(qn('w:bCs')):
-                    rPr.remove(elem)
+            self._set_font_italic(rPr, font_cfg['italic'])
+
+    @staticmethod
+    def _set_font_family(rPr, family: str) -> None:
+        """Устанавливает семейство шрифта в w:rPr стиля параграфа."""
+        rFonts = _get_or_add_child(rPr, 'w:rFonts')
+        for attr in _RFONTS_ATTRS:
+            rFonts.set(attr, family)
+
+    @staticmethod
+    def _set_font_size(rPr, size_pt: float) -> None:
+        """Устанавливает размер шрифта в w:rPr стиля параграфа."""
+        half_points = str(int(size_pt * 2))
+
+        # Размер шрифта
+        _get_or_add_child(rPr, 'w:sz').set(_QN_VAL, half_points)
+
+        # Размер для комплексных скриптов
+        _get_or_add_child(rPr, 'w:szCs').set(_QN_VAL, half_points)
+
+    @staticmethod
+    def _set_font_bold(rPr, is_bold: bool) -> None:
+        """Устанавливает жирность шрифта в w:rPr стиля параграфа."""
+        if is_bold:
+            _get_or_add_child(rPr, 'w:b')
+            _get_or_add_child(rPr, 'w:bCs')
         else:
-            style.font.bold = is_bold
-
-    def _set_font_italic(self, style, is_italic: bool) -> None:
-        """Устанавливает курсив шрифта."""
-        if style.type == WD_STYLE_TYPE.PARAGRAPH:
-            pPr = style.element.get_or_add_pPr()
-            rPr = pPr.find(qn('w:rPr'))
-            if rPr is None:
-                rPr_xml = f'<w:rPr {nsdecls("w")}></w:rPr>'
-                rPr = parse_xml(rPr_xml)
-                pPr.append(rPr)
-
-            if is_italic:
-                i_elem = rPr.find(qn('w:i'))
-                if i_elem is None:
-                    i_xml = f'<w:i {nsdecls("w")}/>'
-                    i_elem = parse_xml(i_xml)
-                    rPr.append(i_elem)
-
-                iCs_elem = rPr.find(qn('w:iCs'))
-                if iCs_elem is None:
-                    iCs_xml = f'<w:iCs {nsdecls("w")}/>'
-                    iCs_elem = parse_xml(iCs_xml)
-                    rPr.append(iCs_elem)
-            else:
-                for elem in rPr.findall(qn('w:i')):
-                    rPr.remove(elem)
-                for elem in rPr.findall(qn('w:iCs')):
-                    rPr.remove(elem)
+            # Оба тега удаляются за один обход дочерних элементов rPr
+            for elem in list(rPr.iterchildren(_QN_B, _QN_BCS)):
+                rPr.remove(elem)
+
+    @staticmethod
+    def _set_font_italic(rPr, is_italic: bool) -> None:
+        """Устанавливает курсив шрифта в w:rPr стиля параграфа."""
+        if is_italic:
+            _get_or_add_child(rPr, 'w:i')
+            _get_or_add_child(rPr, 'w:iCs')
         else:
-            style.font.italic = is_italic
+            # Оба тега удаляются за один обход дочерних элементов rPr
+            for elem in list(rPr.iterchildren(_QN_I, _QN_ICS)):
+                rPr.remove(elem)
@@ -1,17 +1,60 @@
+import io
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from docxtpl import DocxTemplate, InlineImage
 from docxcompose.composer import Composer
 from docx import Document
-from docx.shared import Mm, Pt
-from docx.oxml.ns import qn, nsdecls
-from docx.oxml import parse_xml
-from typing import Dict, Any
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.enum.text import WD_LINE_SPACING
+from docx.shared import Emu, Mm, Pt, Twips
+from docx.oxml.ns import qn
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..models import DocumentConfig, ProcessorError
+from ..utils import save_document, set_run_fonts
 
 logger = logging.getLogger(__name__)
 
+# Переменные шаблона титульного листа: имя в шаблоне -> ключ элемента конфигурации
+_TITLE_KEYS = (
+    ('agency_name', 'agency_name'),
+    ('st_type', 'standart_type'),
+    ('designation', 'designation'),
+    ('title', 'title'),
+    ('status', 'status'),
+    ('city', 'city'),
+    ('publisher_info', 'publisher_info'),
+    ('current_year', 'current_year'),
+)
+
+# Кэш шаблонов титульного листа: путь -> (mtime, содержимое файла)
+_TEMPLATE_CACHE: Dict[str, Tuple[float, bytes]] = {}
+
+
+def _load_template_bytes(template_path: str) -> bytes:
+    """
+    Возвращает содержимое шаблона, читая файл с диска только при первом
+    обращении или после его изменения.
+
+    Args:
+        template_path: Путь к .docx шаблону.
+
+    Returns:
+        Байты .docx шаблона.
+    """
+    mtime = os.path.getmtime(template_path)
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(template_path, 'rb') as f:
+        data = f.read()
+    _TEMPLATE_CACHE[template_path] = (mtime, data)
+    logger.debug(f"Шаблон титульного листа загружен в кэш: {template_path}")
+    return data
+
 
 class TitleProcessor:
     """Обработчик титульного листа документа."""
@@ -50,215 +93,312 @@ class TitleProcessor:
             self.logger.error(f"Ошибка добавления титульного листа: {e}")
             raise ProcessorError(f"Ошибка добавления титульного листа: {e}")
 
+    def add_title_page(self, source_doc: Document) -> Document:
+        """
+        Добавляет титульный лист к документу в памяти, без записи на диск.
+
+        Args:
+            source_doc: Исходный документ.
+
+        Returns:
+            Документ с титульным листом (если титул отключен — исходный документ).
+
+        Raises:
+            ProcessorError: Если не удалось добавить титульный лист.
+        """
+        try:
+            title_config = self.config.structure.title_page
+            if not title_config.enabled:
+                self.logger.info("Титульный лист отключен в конфигурации")
+                return source_doc
+
+            self.logger.info("Начало добавления титульного листа")
+            doc = self._compose(self._render_title(title_config), source_doc)
+            self.logger.info("Титульный лист успешно добавлен")
+            return doc
+        except Exception as e:
+            self.logger.error(f"Ошибка добавления титульного листа: {e}")
+            raise ProcessorError(f"Ошибка добавления титульного листа: {e}")
+
+    def apply_batch(self, jobs: List[Tuple[str, str]], max_workers: Optional[int] = None) -> None:
+        """
+        Добавляет титульный лист к нескольким документам в пуле процессов.
+
+        Документы обрабатываются независимо, поэтому работа распределяется
+        между процессами: разбор и сериализация XML не упираются в GIL.
+
+        Args:
+            jobs: Пары (путь к исходному документу, путь для сохранения результата).
+            max_workers: Число процессов (по умолчанию — число ядер).
+
+        Raises:
+            ProcessorError: Если не удалось обработать хотя бы один документ.
+        """
+        if not jobs:
+            return
+
+        workers = max_workers or os.cpu_count() or 1
+        # Несколько задач на процесс за одну передачу, чтобы сократить накладные расходы IPC
+        chunksize = max(1, len(jobs) // (workers * 4))
+        self.logger.info(f"Пакетное добавление титульного листа: {len(jobs)} документов, {workers} процессов")
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(self.config,)
+        ) as executor:
+            for _ in executor.map(_apply_batch_job, jobs, chunksize=chunksize):
+                pass
+
     def _add_title_page(self, source_doc_path: str, output_path: str, title_config: Any) -> None:
         """Добавляет титульный лист к документу."""
+        doc = self._compose(self._render_title(title_config), Document(source_doc_path))
+        save_document(doc, output_path)
+
+    def _render_title(self, title_config: Any) -> Document:
+        """Рендерит титульный лист из шаблона и применяет к нему форматирование."""
         # Парсим элементы конфигурации в словарь
         elements = self._parse_elements(title_config.elements)
 
         # Рендерим титульный лист
-        title_doc = DocxTemplate(title_config.template_path)
-        context = {
-            'agency_name': elements.get('agency_name', ''),
-            'st_type': elements.get('standart_type', ''),
-            'image': InlineImage(title_doc, title_config.image_path, width=Mm(42)),
-            'designation': elements.get('designation', ''),
-            'title': elements.get('title', ''),
-            'status': elements.get('status', ''),
-            'city': elements.get('city', ''),
-            'publisher_info': elements.get('publisher_info', ''),
-            'current_year': elements.get('current_year', ''),
-        }
+        template_bytes = _load_template_bytes(title_config.template_path)
+        title_doc = DocxTemplate(io.BytesIO(template_bytes))
+        context = {name: elements.get(key, '') for name, key in _TITLE_KEYS}
+        context['image'] = InlineImage(title_doc, title_config.image_path, width=Mm(42))
         title_doc.render(context)
         # После рендера принудительно установим семейство шрифта из конфигурации
         try:
             main_family = self.config.general.fonts['main'].get('family', None)
-            if main_family:
-                # применяем к параграфам и таблицам рендеренного титула
-                self._apply_font_to_doc(title_doc, main_family)
-                # если в шаблоне есть стиль Custom_Title — установим его font.name тоже
-                try:
-                    st = title_doc.styles['Custom_Title']
-                    st.font.name = main_family
-                except Exception:
-                    pass
         except Exception:
-            pass
+            main_family = None
+        if main_family:
+            # если в шаблоне есть стиль Custom_Title — установим его font.name тоже
+            try:
+                st = title_doc.styles['Custom_Title']
+                st.font.name = main_family
+            except Exception:
+                pass
 
-        title_doc.save("temp_title.docx")
+        # Шрифт и интервалы параграфов и таблиц рендеренного титула — одним проходом
+        self._apply_formatting_to_doc(title_doc, title_config, main_family)
 
-        # Применяем дополнительное форматирование (spacing, table formatting)
-        self._apply_formatting_to_doc(title_doc, title_config)
+        # Отрендеренный титул используется напрямую, без сериализации и повторного разбора
+        return title_doc.docx
 
-        title_doc.save("temp_title.docx")
+    def _compose(self, title: Document, source_doc: Document) -> Document:
+        """Вставляет титульный лист в начало документа и возвращает результат."""
+        if self._can_splice(title):
+            self._splice_title(title, source_doc)
+            return source_doc
 
-        # Объединяем документы
-        composer = Composer(Document())
-        composer.append(Document("temp_title.docx"))
-        composer.append(Document(source_doc_path))
-        composer.save(output_path)
-        
-        # Очищаем временный файл
-        os.remove("temp_title.docx")
+        # Нумерация, гиперссылки и прочие связи переносятся через docxcompose
+        self.logger.debug("Титул содержит связи, требующие docxcompose")
+        composer = Composer(source_doc)
+        composer.insert(0, title)
+        return composer.doc
 
     @staticmethod
-    def _parse_elements(elements_list: list) -> Dict[str, str]:
-        """Парсит список элементов конфигурации в словарь."""
-        result = {}
-        for item in elements_list:
-            if item and isinstance(item, dict):
-                key, value = next(iter(item.items()))
-                result[key] = value
-        return result
-
-    def _apply_font_to_doc(self, doc: Document, family: str) -> None:
-        """Apply run-level font family to all runs in a Document (paragraphs and table cells)."""
-        for paragraph in doc.paragraphs:
-            for run in paragraph.runs:
-                try:
-                    run.font.name = family
-                    # ensure run rFonts are set to override theme
-                    rPr = run._element.find(qn('w:rPr'))
-                    if rPr is None:
-                        rPr = parse_xml(f'<w:rPr {nsdecls("w")}></w:rPr>')
-                        run._element.insert(0, rPr)
-                    rFonts = rPr.find(qn('w:rFonts'))
-                    if rFonts is None:
-                        rFonts = parse_xml(f'<w:rFonts {nsdecls("w")}></w:rFonts>')
-                        rPr.append(rFonts)
-                    rFonts.set(qn('w:ascii'), family)
-                    rFonts.set(qn('w:hAnsi'), family)
-                    rFonts.set(qn('w:cs'), family)
-                except Exception:
-                    pass
-
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        for run in paragraph.runs:
-                            try:
-                                run.font.name = family
-                                rPr = run._element.find(qn('w:rPr'))
-                                if rPr is None:
-                                    rPr = parse_xml(f'<w:rPr {nsdecls("w")}></w:rPr>')
-                                    run._element.insert(0, rPr)
-                                rFonts = rPr.find(qn('w:rFonts'))
-                                if rFonts is None:
-                                    rFonts = parse_xml(f'<w:rFonts {nsdecls("w")}></w:rFonts>')
-                                    rPr.append(rFonts)
-                                rFonts.set(qn('w:ascii'), family)
-                                rFonts.set(qn('w:hAnsi'), family)
-                                rFonts.set(qn('w:cs'), family)
-                            except Exception:
-                                pass
-    def _apply_formatting_to_doc(self, doc: Document, title_config: Any) -> None:
+    def _can_splice(title: Document) -> bool:
         """
-        Применяет форматирование (spacing, table formatting) к документу.
-        
-        Args:
-            doc: Документ для форматирования.
-            title_config: Конфигурация титульной страницы.
+        Проверяет, можно ли перенести тело титула простым копированием XML.
+
+        Допускаются только связи с изображениями: их части копируются
+        в целевой документ. Списки (w:numPr в параграфах или в используемых
+        стилях), сноски, примечания и прочие связи требуют docxcompose.
         """
-        # Применяем line spacing к параграфам
-        if title_config.line_spacing:
-            self._apply_line_spacing_to_doc(doc, title_config.line_spacing)
-        
-        # Применяем spacing_before и spacing_after к параграфам
-        if title_config.spacing_before or title_config.spacing_after:
-            self._apply_paragraph_spacing(doc, title_config.spacing_before, title_config.spacing_after)
-        
-        # Применяем форматирование таблиц если необходимо
-        if title_config.table_format and title_config.table_format.apply_font:
-            main_family = self.config.general.fonts['main'].get('family', None)
-            if main_family:
-                self._format_tables(doc, main_family, title_config.table_format)
-        
-        self.logger.debug("Форматирование документа успешно применено")
+        body = title.element.body
+        if body.xpath('.//w:numPr | .//w:footnoteReference | .//w:endnoteReference'
+                      ' | .//w:commentReference'):
+            return False
+        if TitleProcessor._styles_use_numbering(title):
+            return False
+        # Связанные (r:link) изображения при переносе не перепривязываются
+        if body.xpath('.//@r:link'):
+            return False
+        rels = title.part.rels
+        for rid in body.xpath('.//@r:id | .//@r:embed'):
+            rel = rels.get(rid)
+            if rel is None or rel.is_external or rel.reltype != RT.IMAGE:
+                return False
+        return True
 
-    def _apply_line_spacing_to_doc(self, doc: Document, line_spacing: float) -> None:
+    @staticmethod
+    def _styles_use_numbering(title: Document) -> bool:
         """
-        Применяет межстрочный интервал ко всем параграфам в документе.
-        
-        Args:
-            doc: Документ.
-            line_spacing: Коэффициент межстрочного интервала (e.g., 1.5 для 1.5 интервала).
+        Проверяет, ссылается ли какой-либо стиль тела титула (с учётом
+        цепочки w:basedOn) на нумерацию: numbering.xml при переносе
+        не объединяется, и numId в целевом документе был бы неверным.
         """
-        for paragraph in doc.paragraphs:
-            paragraph.paragraph_format.line_spacing = line_spacing
-        
-        # Также применяем к параграфам в таблицах
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        paragraph.paragraph_format.line_spacing = line_spacing
-        
-        self.logger.debug(f"Межстрочный интервал {line_spacing} применен ко всему документу")
-
-    def _apply_paragraph_spacing(self, doc: Document, spacing_before: float, spacing_after: float) -> None:
+        title_styles = title.styles.element
+        seen = set()
+        pending = [
+            ref.get(qn('w:val'))
+            for ref in title.element.body.iter(qn('w:pStyle'), qn('w:rStyle'), qn('w:tblStyle'))
+        ]
+        while pending:
+            style_id = pending.pop()
+            if style_id in seen:
+                continue
+            seen.add(style_id)
+            style = title_styles.get_by_id(style_id)
+            if style is None:
+                continue
+            if style.xpath('./w:pPr/w:numPr'):
+                return True
+            pending.extend(ref.get(qn('w:val')) for ref in style.iterchildren(qn('w:basedOn')))
+        return False
+
+    def _splice_title(self, title: Document, target: Document) -> None:
         """
-        Применяет spacing before/after ко всем параграфам.
-        
+        Переносит содержимое тела титула в начало тела целевого документа.
+
+        Элементы перемещаются, а не копируются: после вызова тело титула
+        пусто, и в памяти не держатся две копии его XML-дерева.
+
         Args:
-            doc: Документ.
-            spacing_before: Промежуток перед параграфом в пунктах (pt).
-            spacing_after: Промежуток после параграфа в пунктах (pt).
+            title: Отрендеренный титульный лист (расходуется).
+            target: Документ, в начало которого вставляется титул.
         """
-        for paragraph in doc.paragraphs:
-            if spacing_before > 0:
-                paragraph.paragraph_format.space_before = Pt(spacing_before)
-            if spacing_after > 0:
-                paragraph.paragraph_format.space_after = Pt(spacing_after)
-        
-        # Также применяем к параграфам в таблицах
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        if spacing_before > 0:
-                            paragraph.paragraph_format.space_before = Pt(spacing_before)
-                        if spacing_after > 0:
-                            paragraph.paragraph_format.space_after = Pt(spacing_after)
-        
-        self.logger.debug(f"Spacing before={spacing_before}, after={spacing_after} применены")
-
-    def _format_tables(self, doc: Document, font_family: str, table_format: Any) -> None:
+        self._copy_missing_styles(title, target)
+
+        target_body = target.element.body
+        next_docpr_id = self._next_id(target_body, './/wp:docPr/@id')
+        next_cnvpr_id = self._next_id(target_body, './/pic:cNvPr/@id')
+        next_bookmark_id = self._next_id(
+            target_body, './/w:bookmarkStart/@w:id | .//w:bookmarkEnd/@w:id'
+        )
+        # Начало и конец закладки могут лежать в разных элементах тела
+        bookmark_ids = {}
+
+        index = 0
+        for element in list(title.element.body):
+            if element.tag == qn('w:sectPr'):
+                continue
+
+            # Переносим изображения и перепривязываем их rId
+            for node in element.xpath('.//*[@r:embed or @r:id]'):
+                for attr in (qn('r:embed'), qn('r:id')):
+                    rid = node.get(attr)
+                    if rid is None:
+                        continue
+                    image_part = title.part.related_parts[rid]
+                    new_rid, _ = target.part.get_or_add_image(io.BytesIO(image_part.blob))
+                    node.set(attr, new_rid)
+
+            # Идентификаторы рисунков должны быть уникальны в документе
+            for docpr in element.xpath('.//wp:docPr'):
+                docpr.set('id', str(next_docpr_id))
+                next_docpr_id += 1
+            for cnvpr in element.xpath('.//pic:cNvPr'):
+                cnvpr.set('id', str(next_cnvpr_id))
+                next_cnvpr_id += 1
+
+            # Идентификаторы закладок тоже не должны совпадать с целевыми
+            for bookmark in element.xpath('.//w:bookmarkStart | .//w:bookmarkEnd'):
+                old_id = bookmark.get(qn('w:id'))
+                if old_id not in bookmark_ids:
+                    bookmark_ids[old_id] = str(next_bookmark_id)
+                    next_bookmark_id += 1
+                bookmark.set(qn('w:id'), bookmark_ids[old_id])
+
+            target_body.insert(index, element)
+            index += 1
+
+    @staticmethod
+    def _next_id(body, path: str) -> int:
+        """Возвращает идентификатор, следующий за максимальным в теле документа."""
+        return max((int(value) for value in body.xpath(path)), default=0) + 1
+
+    @staticmethod
+    def _copy_missing_styles(title: Document, target: Document) -> None:
+        """Копирует в целевой документ стили титула, которых в нём нет."""
+        title_styles = title.styles.element
+        target_styles = target.styles.element
+        known = {
+            style.get(qn('w:styleId'))
+            for style in target_styles.iterchildren(qn('w:style'))
+        }
+        pending = [
+            ref.get(qn('w:val'))
+            for ref in title.element.body.iter(qn('w:pStyle'), qn('w:rStyle'), qn('w:tblStyle'))
+        ]
+        while pending:
+            style_id = pending.pop()
+            if style_id in known:
+                continue
+            known.add(style_id)
+            style = title_styles.get_by_id(style_id)
+            if style is None:
+                continue
+            target_styles.append(deepcopy(style))
+            # Базовые и связанные стили тоже должны существовать
+            pending.extend(
+                ref.get(qn('w:val'))
+                for ref in style.iter(qn('w:basedOn'), qn('w:link'), qn('w:next'))
+            )
+
+    @staticmethod
+    def _parse_elements(elements_list: list) -> Dict[str, str]:
+        """Парсит список элементов конфигурации в словарь."""
+        result = {}
+        for item in elements_list:
+            if item and isinstance(item, dict):
+                result.update(item)
+        return result
+
+    def _apply_formatting_to_doc(self, doc: Document, title_config: Any,
+                                 font_family: Optional[str]) -> None:
         """
-        Применяет форматирование к таблицам.
-        
+        Применяет шрифт, межстрочный интервал и spacing before/after
+        к параграфам титула за один проход.
+
+        Обрабатываются параграфы тела и ячеек таблиц верхнего уровня.
+
         Args:
             doc: Документ.
-            font_family: Семейство шрифтов.
-            table_format: Конфигурация форматирования таблиц.
+            title_config: Конфигурация титульной страницы.
+            font_family: Семейство шрифта для runs (None — шрифт не меняется).
         """
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    # Применяем форматирование шрифта к ячейкам
-                    if table_format.apply_font:
-                        for paragraph in cell.paragraphs:
-                            for run in paragraph.runs:
-                                try:
-                                    run.font.name = font_family
-                                    # Установим XML-уровневые атрибуты
-                                    rPr = run._element.find(qn('w:rPr'))
-                                    if rPr is None:
-                                        rPr = parse_xml(f'<w:rPr {nsdecls("w")}></w:rPr>')
-                                        run._element.insert(0, rPr)
-                                    rFonts = rPr.find(qn('w:rFonts'))
-                                    if rFonts is None:
-                                        rFonts = parse_xml(f'<w:rFonts {nsdecls("w")}></w:rFonts>')
-                                        rPr.append(rFonts)
-                                    rFonts.set(qn('w:ascii'), font_family)
-                                    rFonts.set(qn('w:hAnsi'), font_family)
-                                    rFonts.set(qn('w:cs'), font_family)
-                                except Exception:
-                                    pass
-                    
-                    # Применяем spacing если задано
-                    if table_format.apply_spacing:
-                        for paragraph in cell.paragraphs:
-                            if hasattr(table_format, 'line_spacing') and table_format.line_spacing:
-                                paragraph.paragraph_format.line_spacing = table_format.line_spacing
-        
-        self.logger.debug("Форматирование таблиц успешно применено")
\ No newline at end of file
+        # Значения одинаковы для всех параграфов — вычисляем их один раз
+        # (те же, что дают paragraph_format.line_spacing/space_before/space_after)
+        line_spacing = title_config.line_spacing
+        line = Emu(line_spacing * Twips(240)) if line_spacing else None
+        space_before = Pt(title_config.spacing_before) if title_config.spacing_before > 0 else None
+        space_after = Pt(title_config.spacing_after) if title_config.spacing_after > 0 else None
+        set_spacing = line is not None or space_before is not None or space_after is not None
+
+        for p in doc.element.body.xpath('./w:p | ./w:tbl/w:tr/w:tc/w:p'):
+            if set_spacing:
+                pPr = p.get_or_add_pPr()
+                if line is not None:
+                    pPr.spacing_line = line
+                    pPr.spacing_lineRule = WD_LINE_SPACING.MULTIPLE
+                if space_before is not None:
+                    pPr.spacing_before = space_before
+                if space_after is not None:
+                    pPr.spacing_after = space_after
+
+            if font_family:
+                for r in p.iterchildren(qn('w:r')):
+                    set_run_fonts(r, font_family)
+
+        self.logger.debug(
+            "Форматирование титула применено: line_spacing=%s, before=%s, after=%s",
+            line_spacing, title_config.spacing_before, title_config.spacing_after
+        )
+
+
+# Процессор титульного листа в рабочем процессе пакетной обработки
+_batch_processor: Optional[TitleProcessor] = None
+
+
+def _init_batch_worker(config: DocumentConfig) -> None:
+    """Создаёт процессор один раз на рабочий процесс (конфигурация передаётся однократно)."""
+    global _batch_processor
+    _batch_processor = TitleProcessor(config)
+
+
+def _apply_batch_job(job: Tuple[str, str]) -> None:
+    """Добавляет титульный лист к одному документу пакета."""
+    source_doc_path, output_path = job
+    _batch_processor.apply(source_doc_path, output_path)
@@ -121,7 +121,8 @@ class TOCProcessor:
         """
         return self.HEADING_STYLES.get(style_name, 0)
     
-    def _get_paragraph_page_number(self, document: Document, paragraph) -> int:
+    def _get_paragraph_page_number(self, document: Document, paragraph,
+                                   positions: Optional[Dict] = None) -> int:
         """
         Получить номер страницы для параграфа.
         
@@ -132,13 +133,18 @@ class TOCProcessor:
         Args:
             document: Документ Word
             paragraph: Параграф, для которого нужно найти номер страницы
+            positions: Индексы параграфов документа по их XML-элементам
+                (строится один раз на всё оглавление)
             
         Returns:
             Номер страницы (1-indexed)
         """
+        if positions is None:
+            positions = self._build_paragraph_positions(document)
+        
         try:
             # Получить индекс параграфа
-            para_index = document.paragraphs.index(paragraph)
+            para_index = positions[paragraph._p]
             
             # Приблизительно: 55 строк на страницу (зависит от форматирования)
             # Это примерная оценка для стандартного документа А4
@@ -147,10 +153,26 @@ class TOCProcessor:
             
             return max(1, page_num)
             
-        except (ValueError, IndexError):
+        except KeyError:
             self.logger.warning(f"Не удалось определить номер страницы для параграфа")
             return 1
     
+    @staticmethod
+    def _build_paragraph_positions(document: Document) -> Dict:
+        """
+        Построить словарь индексов параграфов документа.
+        
+        Proxy-объекты Paragraph создаются заново при каждом обращении
+        к document.paragraphs, поэтому ключом служит XML-элемент параграфа.
+        
+        Args:
+            document: Документ Word
+            
+        Returns:
+            Словарь {элемент w:p: индекс параграфа}
+        """
+        return {paragraph._p: idx for idx, paragraph in enumerate(document.paragraphs)}
+    
     def _build_toc_entries(self, document: Document, headings: List) -> List[Dict]:
         """
         Построить записи оглавления с информацией о каждом заголовке.
@@ -171,6 +193,7 @@ class TOCProcessor:
         """
         entries = []
         max_levels = self.config.structure.document_structure.toc.levels
+        positions = self._build_paragraph_positions(document)
         
         for heading in headings:
             level = self._get_heading_level(heading.style.name)
@@ -179,7 +202,7 @@ class TOCProcessor:
             if level >= max_levels:
                 continue
             
-            page_num = self._get_paragraph_page_number(document, heading)
+            page_num = self._get_paragraph_page_number(document, heading, positions)
             
             entries.append({
                 'level': level,
@@ -244,8 +267,8 @@ class TOCProcessor:
         Вставить оглавление в начало документа.
         
         Вставляет:
-        1. Заголовок "ОГЛАВЛЕНИЕ"
-        2. Пустую строку
+        1. Пустую строку (только если в документе уже есть параграфы)
+        2. Заголовок "ОГЛАВЛЕНИЕ"
         3. Все строки оглавления
         4. Пустую строку (разделитель от основного текста)
         
@@ -261,45 +284,31 @@ class TOCProcessor:
         """
         toc_title = self.config.structure.document_structure.toc.title
         
-        # Вставить в начало документа (перед первым параграфом)
-        insert_index = 0
-        
-        # Если первый параграф пустой, вставить туда
-        if document.paragraphs and not document.paragraphs[0].text.strip():
-            insert_index = 0
-        
-        # Вставить заголовок оглавления
-        if document.paragraphs and insert_index < len(document.paragraphs):
-            title_para = document.paragraphs[insert_index].insert_paragraph_before(toc_title)
-        else:
-            title_para = document.add_paragraph(toc_title)
-        
-        # Установить стиль для заголовка
-        title_para.style = 'Heading 1'
+        # Все параграфы оглавления вставляются перед одним и тем же якорем
+        # (первым параграфом документа), поэтому список параграфов
+        # документа строится один раз, а не на каждую вставляемую строку
+        paragraphs = document.paragraphs
+        anchor = paragraphs[0] if paragraphs else None
+        
+        def insert(text: str, style: Optional[str] = None):
+            if anchor is not None:
+                return anchor.insert_paragraph_before(text, style)
+            return document.add_paragraph(text, style)
+        
+        # Разделитель перед заголовком нужен только перед существующим
+        # содержимым: в пустом документе оглавление начинается с заголовка
+        if anchor is not None:
+            insert("")
+        insert(toc_title, 'Heading 1')
         self.logger.debug(f"Вставлен заголовок оглавления: '{toc_title}'")
         
-        # Вставить пустую строку
-        if document.paragraphs and insert_index < len(document.paragraphs):
-            spacer1 = document.paragraphs[insert_index].insert_paragraph_before("")
-        else:
-            spacer1 = document.add_paragraph("")
-        
-        # Вставить строки оглавления
-        for i, line in enumerate(toc_lines):
-            if document.paragraphs and insert_index + i + 2 < len(document.paragraphs):
-                toc_para = document.paragraphs[insert_index + i + 2].insert_paragraph_before(line)
-            else:
-                toc_para = document.add_paragraph(line)
-            
-            # Установить стиль (Normal)
-            toc_para.style = 'Normal'
+        # Вставить строки оглавления со стилем Normal
+        for line in toc_lines:
+            insert(line, 'Normal')
         
         self.logger.debug(f"Вставлено {len(toc_lines)} строк оглавления")
         
         # Вставить разделитель (пустая строка)
-        if document.paragraphs and insert_index + len(toc_lines) + 2 < len(document.paragraphs):
-            spacer2 = document.paragraphs[insert_index + len(toc_lines) + 2].insert_paragraph_before("")
-        else:
-            spacer2 = document.add_paragraph("")
+        insert("")
         
         self.logger.info(f"Оглавление вставлено в начало документа")
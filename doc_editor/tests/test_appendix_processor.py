@@ -15,6 +15,7 @@ import pytest
 from docx import Document
 from docx.shared import Pt, RGBColor
 from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
 
 from doc_editor.models.config import (
     DocumentConfig,
@@ -235,6 +236,33 @@ class TestAppendixDetection:
         
         assert len(headings) >= 0  # May or may not detect depending on implementation
     
+    def test_find_appendix_keyword_forms(self, appendix_processor):
+        """Test detection of keyword forms and case variants."""
+        doc = Document()
+        doc.add_paragraph("ANNEX 1", style='Heading 1')
+        doc.add_paragraph("Сведения к приложению Б", style='Heading 2')
+        doc.add_paragraph("Appendices overview", style='Heading 1')
+        doc.add_paragraph("Приложения", style='Heading 1')
+        doc.add_paragraph("Appendix A", style='Normal')
+
+        headings = appendix_processor._find_appendix_headings(doc)
+
+        assert headings == [
+            (0, "ANNEX 1"),
+            (1, "Сведения к приложению Б"),
+            (2, "Appendices overview"),
+        ]
+
+    def test_style_without_type_does_not_break_processing(self, appendix_processor):
+        """Test that a w:style without w:type does not stop appendix numbering."""
+        doc = Document()
+        doc.add_paragraph("Appendix: Details", style='Heading 1')
+        del doc.styles['Title'].element.attrib[qn('w:type')]
+
+        appendix_processor.process_appendices(doc)
+
+        assert doc.paragraphs[0].text == "Appendix A: Details"
+
     def test_find_appendix_empty_document(self, appendix_processor,
                                           empty_document):
         """Test that finding appendices in empty document is safe."""
@@ -263,6 +291,13 @@ class TestAppendixNumbering:
         
         # Should have valid letters
         assert all(len(l) == 1 for l in letters)
+
+    def test_letter_numbering_double_letters(self, appendix_processor):
+        """Test double letters after Z and numeric fallback."""
+        assert appendix_processor._get_appendix_letter(25) == 'Z'
+        assert appendix_processor._get_appendix_letter(26) == 'AA'
+        assert appendix_processor._get_appendix_letter(701) == 'ZZ'
+        assert appendix_processor._get_appendix_letter(702) == '703'
     
     def test_number_numbering_style(self):
         """Test numeric numbering style configuration."""
@@ -411,6 +446,34 @@ class TestAppendixWithTables:
         except Exception as e:
             pytest.fail(f"Should handle multiple tables in appendix: {e}")
 
+    def test_heading_after_table_keeps_index(self, appendix_processor):
+        """Test that table cell paragraphs do not shift heading indexes."""
+        doc = Document()
+        table = doc.add_table(rows=1, cols=1)
+        table.cell(0, 0).paragraphs[0].style = doc.styles['Heading 1']
+        table.cell(0, 0).paragraphs[0].text = "Appendix in table"
+        doc.add_paragraph("Text", style='Normal')
+        doc.add_paragraph("Appendix: Data", style='Heading 1')
+
+        appendix_processor.process_appendices(doc)
+
+        assert [p.text for p in doc.paragraphs] == ["Text", "Appendix A: Data"]
+        assert table.cell(0, 0).text == "Appendix in table"
+
+    def test_numbering_keeps_first_run_formatting(self, appendix_processor):
+        """Test that renumbering keeps the heading's first run formatting."""
+        doc = Document()
+        heading = doc.add_paragraph(style='Heading 1')
+        heading.add_run("Appendix").bold = True
+        heading.add_run(": Results").italic = True
+
+        appendix_processor.process_appendices(doc)
+
+        assert heading.text == "Appendix A: Results"
+        assert len(heading.runs) == 1
+        assert heading.runs[0].bold is True
+        assert heading.style.name == 'Heading 1'
+
 
 class TestAppendixIntegration:
     """Test integration with document processing pipeline."""
@@ -0,0 +1,175 @@
+"""
+Тесты для ConfigParser - загрузки и валидации конфигурации.
+"""
+
+import json
+import os
+
+import pytest
+
+from doc_editor.models import ConfigParsingError, ConfigValidationError, DocumentConfig
+from doc_editor.parsers import ConfigParser
+from doc_editor.parsers import config_parser
+
+CONFIG_CONTENT = """
+document:
+  general:
+    margins:
+      left: 20mm
+      right: 10mm
+      top: 20mm
+      bottom: 20mm
+    fonts:
+      main:
+        family: Arial
+        size: 12pt
+    spacing:
+      line: 1.5
+  structure:
+    title_page:
+      enabled: false
+"""
+
+
+class TestConfigJsonCache:
+    """Тесты JSON-кэша конфигурации."""
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        """Создать файл конфигурации."""
+        path = tmp_path / "config.yaml"
+        path.write_text(CONFIG_CONTENT, encoding='utf-8')
+        return path
+
+    def test_cache_written_after_load(self, config_file):
+        """После загрузки рядом с YAML появляется JSON-кэш."""
+        config = ConfigParser.from_file(str(config_file))
+
+        cache_path = str(config_file) + '.cache.json'
+        assert isinstance(config, DocumentConfig)
+        assert os.path.exists(cache_path)
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        assert cached['data']['document']['general']['fonts']['main']['family'] == 'Arial'
+
+    def test_cache_used_on_repeat_load(self, config_file, monkeypatch):
+        """Повторная загрузка не разбирает YAML."""
+        ConfigParser.from_file(str(config_file))
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("YAML не должен разбираться повторно")
+
+        monkeypatch.setattr(config_parser.yaml, 'load', fail_load)
+        config = ConfigParser.from_file(str(config_file))
+
+        assert config.general.margins.left == '20mm'
+
+    def test_cache_invalidated_on_change(self, config_file):
+        """Изменённый YAML разбирается заново."""
+        ConfigParser.from_file(str(config_file))
+
+        config_file.write_text(CONFIG_CONTENT.replace('20mm', '25mm'), encoding='utf-8')
+        config = ConfigParser.from_file(str(config_file))
+
+        assert config.general.margins.left == '25mm'
+
+    def test_corrupt_cache_ignored(self, config_file):
+        """Повреждённый кэш не мешает загрузке."""
+        cache_path = str(config_file) + '.cache.json'
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write("{not json")
+
+        config = ConfigParser.from_file(str(config_file))
+
+        assert config.general.margins.right == '10mm'
+
+    def test_memory_cache_size_is_bounded(self, tmp_path_factory):
+        """Загрузки из многих временных каталогов не раздувают кэш в памяти."""
+        limit = config_parser._PAYLOAD_CACHE_SIZE
+        paths = []
+        for _ in range(limit + 5):
+            path = tmp_path_factory.mktemp("request") / "config.yaml"
+            path.write_text(CONFIG_CONTENT, encoding='utf-8')
+            ConfigParser.from_file(str(path))
+            paths.append(os.path.abspath(path))
+
+        assert len(config_parser._PAYLOAD_CACHE) <= limit
+        assert paths[-1] in config_parser._PAYLOAD_CACHE
+        assert paths[0] not in config_parser._PAYLOAD_CACHE
+
+    def test_non_json_data_not_cached(self, tmp_path):
+        """Данные без JSON-представления не кэшируются."""
+        path = tmp_path / "config.yaml"
+        path.write_text(CONFIG_CONTENT + "  released: 2024-01-01\n", encoding='utf-8')
+
+        ConfigParser.from_file(str(path))
+
+        assert not os.path.exists(str(path) + '.cache.json')
+
+    def test_repeat_load_served_from_memory(self, config_file, monkeypatch):
+        """Повторная загрузка в процессе не читает ни YAML, ни файл кэша."""
+        ConfigParser.from_file(str(config_file))
+        os.remove(str(config_file) + '.cache.json')
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("YAML не должен разбираться повторно")
+
+        monkeypatch.setattr(config_parser.yaml, 'load', fail_load)
+        config = ConfigParser.from_file(str(config_file))
+
+        assert config.general.margins.bottom == '20mm'
+
+    def test_repeat_load_returns_independent_config(self, config_file):
+        """Изменение одной конфигурации не влияет на следующую загрузку."""
+        first = ConfigParser.from_file(str(config_file))
+        first.general.fonts['main']['family'] = 'Times New Roman'
+
+        second = ConfigParser.from_file(str(config_file))
+
+        assert second is not first
+        assert second.general.fonts['main']['family'] == 'Arial'
+
+    def test_missing_file_raises(self, tmp_path):
+        """Отсутствующий файл конфигурации приводит к ошибке парсинга."""
+        with pytest.raises(ConfigParsingError):
+            ConfigParser.from_file(str(tmp_path / "missing.yaml"))
+
+
+class TestConfigValidation:
+    """Тесты валидации обязательных полей конфигурации."""
+
+    def test_missing_required_field(self):
+        """Отсутствие обязательного поля приводит к ошибке с его путём."""
+        data = {'document': {'general': {'margins': {}, 'fonts': {}}, 'structure': {}}}
+
+        with pytest.raises(ConfigValidationError, match='document.general.spacing'):
+            ConfigParser.from_dict(data)
+
+    def test_non_dict_section(self):
+        """Раздел, не являющийся словарём, не проходит валидацию."""
+        data = {'document': {'general': 'invalid', 'structure': {}}}
+
+        with pytest.raises(ConfigValidationError, match='document.general.margins'):
+            ConfigParser.from_dict(data)
+
+    def test_from_dict_keeps_input_intact(self):
+        """Разбор не изменяет исходный словарь и может быть повторён."""
+        data = {
+            'document': {
+                'general': {'margins': {}, 'fonts': {}, 'spacing': {}},
+                'structure': {
+                    'numbering': {
+                        'headers': {'right_parts': [{'text': 'ГОСТ', 'bold': True}]}
+                    }
+                },
+            }
+        }
+
+        first = ConfigParser.from_dict(data)
+        second = ConfigParser.from_dict(data)
+
+        assert data['document']['structure']['numbering']['headers']['right_parts'] == [
+            {'text': 'ГОСТ', 'bold': True}
+        ]
+        assert first.structure.numbering.headers.right_parts[0].bold
+        assert second.structure.numbering.headers.right_parts[0].text == 'ГОСТ'
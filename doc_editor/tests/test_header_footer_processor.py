@@ -0,0 +1,95 @@
+"""
+Тесты для HeaderFooterProcessor - колонтитулов документа.
+"""
+
+import pytest
+from docx import Document
+from docx.enum.section import WD_SECTION
+from docx.oxml.ns import qn
+
+from doc_editor.models.config import (
+    DocumentConfig,
+    GeneralConfig,
+    HeadersConfig,
+    HeaderTextPart,
+    MarginsConfig,
+    NumberingConfig,
+    SpacingConfig,
+    StructureConfig,
+)
+from doc_editor.processors.header_footer_processor import HeaderFooterProcessor
+
+
+class TestHeaderFooterSections:
+    """Тесты колонтитулов документа из нескольких секций."""
+
+    @pytest.fixture
+    def config(self):
+        """Создать конфигурацию с форматированными колонтитулами."""
+        headers = HeadersConfig(
+            enabled=True,
+            page_numbers=True,
+            right_parts=[
+                HeaderTextPart(text="ГОСТ Р", bold=True),
+                HeaderTextPart(text=" (проект)"),
+            ],
+            right="Четный колонтитул",
+        )
+        return DocumentConfig(
+            general=GeneralConfig(
+                margins=MarginsConfig(),
+                fonts={'main': {'family': 'Arial'}},
+                spacing=SpacingConfig()
+            ),
+            structure=StructureConfig(numbering=NumberingConfig(headers=headers))
+        )
+
+    @pytest.fixture
+    def document(self):
+        """Создать документ из трёх несвязанных секций."""
+        doc = Document()
+        doc.add_paragraph("Секция 1")
+        for i in (2, 3):
+            doc.add_section(WD_SECTION.NEW_PAGE)
+            doc.add_paragraph(f"Секция {i}")
+        for section in doc.sections:
+            section.header.is_linked_to_previous = False
+            section.even_page_header.is_linked_to_previous = False
+            section.footer.is_linked_to_previous = False
+            section.even_page_footer.is_linked_to_previous = False
+        return doc
+
+    def test_each_section_gets_headers(self, config, document):
+        """Каждая секция получает одинаковые колонтитулы."""
+        HeaderFooterProcessor(document, config).apply()
+
+        for section in document.sections:
+            header = section.header.paragraphs[0]
+            assert header.text == "ГОСТ Р (проект)"
+            assert header.runs[0].bold is True
+            assert header.runs[0].font.name == 'Arial'
+            assert section.even_page_header.paragraphs[0].text == "Четный колонтитул"
+            assert section.footer._element.xpath('.//w:instrText')[0].text == 'PAGE'
+
+    def test_sections_do_not_share_elements(self, config, document):
+        """Runs копируются в каждую секцию, а не разделяются между ними."""
+        HeaderFooterProcessor(document, config).apply()
+
+        runs = [section.header.paragraphs[0].runs[0]._r for section in document.sections]
+        assert len({id(run) for run in runs}) == len(runs)
+
+        runs[0].find(qn('w:t')).text = "Изменено"
+        assert document.sections[1].header.paragraphs[0].runs[0].text == "ГОСТ Р"
+
+    def test_first_page_parts_cleared_on_repeat(self, config, document):
+        """Повторное применение оставляет колонтитулы первой страницы пустыми."""
+        document.sections[0].first_page_header.paragraphs[0].add_run("Титул")
+
+        HeaderFooterProcessor(document, config).apply()
+        HeaderFooterProcessor(document, config).apply()
+
+        for section in document.sections:
+            hdr = section.first_page_header._element
+            assert len(hdr) == 1
+            assert hdr[0].tag == qn('w:p') and len(hdr[0]) == 0
+            assert len(section.header.paragraphs[0].runs) == 2
@@ -267,6 +267,31 @@ class TestPrefacePositioning:
         # Original heading should still be there
         assert first_heading in [p.text for p in doc.paragraphs]
     
+    def test_preface_lines_keep_order(self, base_config, document_with_content):
+        """Test that preface lines are inserted in order before existing content."""
+        base_config.structure.document_structure.preface.content = "Line 1\n\n  Line 2\nLine 3"
+        processor = PrefaceProcessor(base_config)
+        
+        doc = document_with_content
+        processor.add_preface(doc)
+        
+        texts = [p.text for p in doc.paragraphs]
+        assert texts[:4] == ["Line 1", "Line 2", "Line 3", "Main Section 1"]
+        assert all(p.style.name == 'Normal' for p in doc.paragraphs[:3])
+    
+    def test_preface_inserted_after_leading_table(self, base_config):
+        """Test that preface goes before the first paragraph, not before a leading table."""
+        doc = Document()
+        doc.add_table(rows=1, cols=1)
+        doc.add_paragraph("After table")
+        
+        processor = PrefaceProcessor(base_config)
+        processor.add_preface(doc)
+        
+        body = list(doc.element.body)
+        assert body[0].tag.endswith('}tbl')
+        assert [p.text for p in doc.paragraphs] == ["Это содержание предисловия.", "After table"]
+    
     def test_preface_does_not_duplicate(self, preface_processor, empty_document):
         """Test that multiple calls don't duplicate preface."""
         doc = empty_document
@@ -377,6 +402,16 @@ class TestPrefaceEdgeCases:
         
         assert len(doc.paragraphs) > 0
 
+    
+    def test_preface_content_with_crlf(self, base_config, empty_document):
+        """Test that CRLF line endings and blank lines produce no empty paragraphs."""
+        base_config.structure.document_structure.preface.content = "Line 1\r\n\r\nLine 2\r\n"
+        processor = PrefaceProcessor(base_config)
+        
+        doc = empty_document
+        processor.add_preface(doc)
+        
+        assert [p.text for p in doc.paragraphs] == ["Line 1", "Line 2"]
 
 # ============================================================================
 # TEST SUITE 7: Formatting
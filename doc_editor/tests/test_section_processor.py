@@ -248,6 +248,28 @@ class TestSectionProcessor:
         
         # Проверяем, что текст нумерован
         assert first_para.text.startswith("1 ")
+    
+    def test_style_without_type_does_not_break_numbering(self, processor, simple_document_with_headings):
+        """Проверить, что стиль без w:type не мешает нумерации заголовков."""
+        doc = simple_document_with_headings
+        del doc.styles['Title'].element.attrib[qn('w:type')]
+        
+        processor.apply_section_numbering(doc)
+        
+        texts = [p.text for p in doc.paragraphs]
+        assert texts[0] == "1 Введение"
+        assert texts[1] == "1.1 Общие положения"
+    
+    def test_heading_runs_replaced(self, processor, simple_document_with_headings):
+        """Проверить, что прежние runs удаляются, а не остаются пустыми."""
+        first_para = simple_document_with_headings.paragraphs[0]
+        first_para.add_run(" продолжение")
+        
+        processor.apply_section_numbering(simple_document_with_headings)
+        
+        runs = first_para.runs
+        assert [run.text for run in runs] == ["1 ", "Введение продолжение"]
+        assert all(run.bold for run in runs)
 
 
 class TestSectionProcessorIntegration:
@@ -0,0 +1,101 @@
+"""
+Тесты для StyleProcessor - стилей и шрифтов документа.
+"""
+
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.oxml.ns import qn
+
+from doc_editor.parsers import ConfigParser
+from doc_editor.processors.style_processor import StyleProcessor
+
+TEST_DATA = Path(__file__).parent / "test_data"
+
+
+class TestStyleProcessorFonts:
+    """Тесты применения основного шрифта к документу."""
+
+    @pytest.fixture
+    def config(self):
+        """Загрузить конфигурацию с основным шрифтом Arial."""
+        return ConfigParser.from_file(str(TEST_DATA / "formatConfig.yaml"))
+
+    @pytest.fixture
+    def document(self):
+        """Создать документ с runs в параграфах и в таблице."""
+        doc = Document()
+        doc.add_paragraph("Первый абзац").add_run(" продолжение").font.name = 'Times New Roman'
+        doc.add_table(rows=1, cols=1).cell(0, 0).paragraphs[0].add_run("Ячейка")
+        return doc
+
+    def test_main_font_applied_to_body_runs(self, config, document):
+        """Runs параграфов тела получают основной шрифт, таблицы не затрагиваются."""
+        StyleProcessor(document, config).apply()
+
+        for run in document.paragraphs[0].runs:
+            assert run.font.name == 'Arial'
+            assert run._r.rPr.rFonts.get(qn('w:hAnsi')) == 'Arial'
+        assert document.tables[0].cell(0, 0).paragraphs[0].runs[0].font.name is None
+
+    def test_repeat_apply_keeps_fonts(self, config, document):
+        """Повторное применение не меняет уже установленный шрифт."""
+        StyleProcessor(document, config).apply()
+        before = document.element.body.xml
+
+        StyleProcessor(document, config).apply()
+
+        assert document.element.body.xml == before
+
+
+class TestStyleProcessorFontSettings:
+    """Тесты записи настроек шрифта в w:rPr стиля параграфа."""
+
+    @pytest.fixture
+    def processor(self):
+        """Создать процессор для пустого документа."""
+        config = ConfigParser.from_file(str(TEST_DATA / "formatConfig.yaml"))
+        return StyleProcessor(Document(), config)
+
+    @pytest.fixture
+    def style(self, processor):
+        """Создать стиль параграфа с жирным курсивным шрифтом."""
+        style = processor.doc.styles['Heading 1']
+        processor._apply_font_settings(style, {'bold': True, 'italic': True, 'size': '14pt'})
+        return style
+
+    def _rpr_tags(self, style):
+        rPr = style.element.pPr.find(qn('w:rPr'))
+        return [child.tag for child in rPr]
+
+    def test_bold_and_italic_added(self, style):
+        """Включение жирного и курсива добавляет w:b/w:bCs и w:i/w:iCs."""
+        tags = self._rpr_tags(style)
+
+        for tag in ('w:b', 'w:bCs', 'w:i', 'w:iCs', 'w:sz', 'w:szCs'):
+            assert qn(tag) in tags
+
+    def test_bold_and_italic_removed(self, processor, style):
+        """Отключение удаляет оба тега и не трогает размер."""
+        processor._apply_font_settings(style, {'bold': False, 'italic': False})
+
+        assert self._rpr_tags(style) == [qn('w:sz'), qn('w:szCs')]
+
+
+class TestStyleProcessorLineSpacing:
+    """Тесты межстрочного интервала стилей параграфов."""
+
+    def test_style_without_type_gets_line_spacing(self):
+        """Стиль без w:type считается стилем параграфа и получает интервал."""
+        config = ConfigParser.from_file(str(TEST_DATA / "formatConfig.yaml"))
+        doc = Document()
+        style_elm = doc.styles['Title'].element
+        del style_elm.attrib[qn('w:type')]
+
+        StyleProcessor(doc, config)._apply_line_spacing()
+
+        spacing = style_elm.pPr.find(qn('w:spacing'))
+        assert spacing is not None
+        assert spacing.get(qn('w:lineRule')) == 'auto'
+        assert int(spacing.get(qn('w:line'))) == int(240 * float(config.general.spacing.line))
@@ -0,0 +1,318 @@
+"""
+Тесты для TitleProcessor - добавления титульного листа.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from doc_editor.models import ProcessorError
+from doc_editor.parsers import ConfigParser
+from doc_editor.processors import title_processor
+from doc_editor.processors.title_processor import TitleProcessor, _load_template_bytes
+
+TEST_DATA = Path(__file__).parent / "test_data"
+TEMPLATES = Path(__file__).parent.parent / "templates"
+LOGO_PATH = str(TEMPLATES / "logo.png")
+
+
+@pytest.fixture
+def title_config():
+    """Загрузить конфигурацию с титульным листом из шаблона."""
+    config = ConfigParser.from_file(str(TEST_DATA / "formatConfig.yaml"))
+    config.structure.title_page.template_path = str(TEMPLATES / "title_page_template.docx")
+    config.structure.title_page.image_path = LOGO_PATH
+    return config
+
+
+class TestTemplateCache:
+    """Тесты кэширования шаблонов титульного листа."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Очистить кэш шаблонов до и после теста."""
+        title_processor._TEMPLATE_CACHE.clear()
+        yield
+        title_processor._TEMPLATE_CACHE.clear()
+
+    @pytest.fixture
+    def template_file(self, tmp_path):
+        """Создать файл шаблона."""
+        path = tmp_path / "template.docx"
+        path.write_bytes(b"first")
+        return str(path)
+
+    def test_template_read_once(self, template_file):
+        """Повторная загрузка возвращает закэшированные байты."""
+        first = _load_template_bytes(template_file)
+        second = _load_template_bytes(template_file)
+
+        assert first == b"first"
+        assert second is first
+
+    def test_template_reloaded_after_change(self, template_file):
+        """Изменённый шаблон перечитывается с диска."""
+        _load_template_bytes(template_file)
+
+        with open(template_file, 'wb') as f:
+            f.write(b"second")
+        mtime = os.path.getmtime(template_file) + 10
+        os.utime(template_file, (mtime, mtime))
+
+        assert _load_template_bytes(template_file) == b"second"
+
+    def test_missing_template_raises(self, tmp_path):
+        """Отсутствующий шаблон приводит к ошибке."""
+        with pytest.raises(OSError):
+            _load_template_bytes(str(tmp_path / "missing.docx"))
+
+
+class TestTitleSplice:
+    """Тесты переноса титульного листа в начало документа."""
+
+    @pytest.fixture
+    def title_doc(self):
+        """Создать титул с изображением."""
+        doc = Document()
+        doc.add_paragraph("Титул", style='Title')
+        doc.add_picture(LOGO_PATH)
+        return doc
+
+    @pytest.fixture
+    def source_doc(self):
+        """Создать основной документ."""
+        doc = Document()
+        doc.add_paragraph("Основной текст")
+        return doc
+
+    def test_can_splice_with_image(self, title_doc):
+        """Титул с изображением переносится без docxcompose."""
+        assert TitleProcessor._can_splice(title_doc)
+
+    def test_cannot_splice_with_numbering(self, title_doc):
+        """Титул со списком требует docxcompose."""
+        title_doc.add_paragraph("Пункт", style='List Number')
+        title_doc.paragraphs[-1].paragraph_format.element.get_or_add_pPr().get_or_add_numPr()
+
+        assert not TitleProcessor._can_splice(title_doc)
+
+    def test_cannot_splice_with_footnote_reference(self, title_doc):
+        """Титул со ссылкой на сноску требует docxcompose."""
+        run = title_doc.paragraphs[0].add_run()
+        reference = OxmlElement('w:footnoteReference')
+        reference.set(qn('w:id'), '1')
+        run._r.append(reference)
+
+        assert not TitleProcessor._can_splice(title_doc)
+
+    def test_cannot_splice_with_style_numbering(self, title_doc):
+        """Стиль с нумерацией (в том числе через basedOn) требует docxcompose."""
+        styles = title_doc.styles
+        numbered = styles.add_style('Numbered Base', WD_STYLE_TYPE.PARAGRAPH)
+        numbered.element.get_or_add_pPr().get_or_add_numPr().get_or_add_numId().val = 1
+        derived = styles.add_style('Numbered Item', WD_STYLE_TYPE.PARAGRAPH)
+        derived.base_style = numbered
+        title_doc.add_paragraph("Пункт", style='Numbered Item')
+
+        assert not TitleProcessor._can_splice(title_doc)
+
+    def test_compose_falls_back_to_composer(self, title_doc, source_doc):
+        """Титул со стилем-списком вставляется через docxcompose, а не переносом."""
+        title_doc.add_paragraph("Пункт", style='List Number')
+        moved = title_doc.paragraphs[0]._p
+
+        result = TitleProcessor(None)._compose(title_doc, source_doc)
+
+        texts = [p.text for p in result.paragraphs]
+        assert texts[0] == "Титул"
+        assert "Пункт" in texts
+        assert texts[-1] == "Основной текст"
+        assert result.paragraphs[0]._p is not moved
+
+    def test_splice_prepends_title(self, title_doc, source_doc):
+        """Содержимое титула оказывается перед основным текстом."""
+        processor = TitleProcessor(None)
+        processor._splice_title(title_doc, source_doc)
+
+        texts = [p.text for p in source_doc.paragraphs]
+        assert texts[0] == "Титул"
+        assert texts[-1] == "Основной текст"
+
+    def test_splice_rebinds_images(self, title_doc, source_doc, tmp_path):
+        """Изображение титула доступно в итоговом документе."""
+        processor = TitleProcessor(None)
+        processor._splice_title(title_doc, source_doc)
+
+        output = tmp_path / "output.docx"
+        source_doc.save(output)
+        result = Document(output)
+
+        assert len(result.inline_shapes) == 1
+        rid = result.element.body.xpath('.//a:blip/@r:embed')[0]
+        with open(LOGO_PATH, 'rb') as f:
+            assert result.part.related_parts[rid].blob == f.read()
+
+    def test_cannot_splice_with_linked_image(self, title_doc):
+        """Связанное (r:link) изображение не переносится простым копированием."""
+        blip = title_doc.element.body.xpath('.//a:blip')[0]
+        blip.set(qn('r:link'), blip.get(qn('r:embed')))
+
+        assert not TitleProcessor._can_splice(title_doc)
+
+    def test_splice_renumbers_drawing_ids(self, title_doc, source_doc):
+        """Идентификаторы wp:docPr и pic:cNvPr титула не совпадают с целевыми."""
+        source_doc.add_picture(LOGO_PATH)
+
+        TitleProcessor(None)._splice_title(title_doc, source_doc)
+
+        body = source_doc.element.body
+        for path in ('.//wp:docPr/@id', './/pic:cNvPr/@id'):
+            ids = body.xpath(path)
+            assert len(ids) == 2
+            assert len(set(ids)) == 2
+
+    def test_splice_renumbers_bookmarks(self, title_doc, source_doc):
+        """Закладки титула получают идентификаторы, свободные в документе."""
+        for doc in (title_doc, source_doc):
+            p = doc.paragraphs[0]._p
+            start = OxmlElement('w:bookmarkStart')
+            start.set(qn('w:id'), '0')
+            start.set(qn('w:name'), 'mark')
+            end = OxmlElement('w:bookmarkEnd')
+            end.set(qn('w:id'), '0')
+            p.insert(0, start)
+            p.append(end)
+
+        TitleProcessor(None)._splice_title(title_doc, source_doc)
+
+        body = source_doc.element.body
+        starts = body.xpath('.//w:bookmarkStart/@w:id')
+        ends = body.xpath('.//w:bookmarkEnd/@w:id')
+        assert sorted(starts) == sorted(ends)
+        assert len(set(starts)) == 2
+
+    def test_splice_copies_missing_styles(self, title_doc):
+        """Стили титула, отсутствующие в документе, копируются."""
+        target = Document()
+        styles = target.styles.element
+        styles.remove(styles.get_by_id('Title'))
+
+        TitleProcessor(None)._splice_title(title_doc, target)
+
+        assert styles.get_by_id('Title') is not None
+
+    def test_splice_moves_title_elements(self, title_doc, source_doc):
+        """Элементы титула перемещаются, а не копируются."""
+        moved = title_doc.paragraphs[0]._p
+
+        TitleProcessor(None)._splice_title(title_doc, source_doc)
+
+        assert source_doc.paragraphs[0]._p is moved
+        assert [child.tag for child in title_doc.element.body] == [qn('w:sectPr')]
+
+
+class TestTitleBatch:
+    """Тесты пакетного добавления титульного листа."""
+
+    def test_batch_adds_title_to_each_document(self, title_config, tmp_path):
+        """Каждый документ пакета получает титульный лист."""
+        jobs = []
+        for i in range(3):
+            doc = Document()
+            doc.add_paragraph(f"Документ {i}")
+            source = tmp_path / f"source_{i}.docx"
+            doc.save(source)
+            jobs.append((str(source), str(tmp_path / f"output_{i}.docx")))
+
+        TitleProcessor(title_config).apply_batch(jobs, max_workers=2)
+
+        for i, (_, output) in enumerate(jobs):
+            texts = [p.text for p in Document(output).paragraphs]
+            assert "Название стандарта" in texts
+            assert texts[-1] == f"Документ {i}"
+
+    def test_batch_reports_failures(self, title_config, tmp_path):
+        """Ошибка обработки документа пакета пробрасывается."""
+        jobs = [(str(tmp_path / "missing.docx"), str(tmp_path / "output.docx"))]
+
+        with pytest.raises(ProcessorError):
+            TitleProcessor(title_config).apply_batch(jobs, max_workers=1)
+
+    def test_empty_batch(self, title_config):
+        """Пустой пакет не запускает пул процессов."""
+        TitleProcessor(title_config).apply_batch([])
+
+
+class TestTitleInMemory:
+    """Тесты добавления титульного листа без записи на диск."""
+
+    @pytest.fixture
+    def source_doc(self):
+        """Создать основной документ."""
+        doc = Document()
+        doc.add_paragraph("Основной текст")
+        return doc
+
+    def test_title_added_in_memory(self, title_config, source_doc, tmp_path, monkeypatch):
+        """Титул добавляется без создания файлов."""
+        monkeypatch.chdir(tmp_path)
+
+        result = TitleProcessor(title_config).add_title_page(source_doc)
+
+        texts = [p.text for p in result.paragraphs]
+        assert "Название стандарта" in texts
+        assert texts[-1] == "Основной текст"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disabled_title_returns_source(self, title_config, source_doc):
+        """При отключенном титуле возвращается исходный документ."""
+        title_config.structure.title_page.enabled = False
+
+        result = TitleProcessor(title_config).add_title_page(source_doc)
+
+        assert result is source_doc
+        assert [p.text for p in result.paragraphs] == ["Основной текст"]
+
+
+class TestTitleFormatting:
+    """Тесты форматирования отрендеренного титула."""
+
+    def test_spacing_and_font_applied(self, title_config):
+        """Интервалы и шрифт задаются параграфам тела и ячеек таблиц."""
+        title_page = title_config.structure.title_page
+        title_page.spacing_before = 6
+        title_page.spacing_after = 3
+
+        title = TitleProcessor(title_config)._render_title(title_page)
+
+        paragraphs = list(title.paragraphs)
+        for table in title.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    paragraphs.extend(cell.paragraphs)
+        assert paragraphs
+        for paragraph in paragraphs:
+            fmt = paragraph.paragraph_format
+            assert fmt.line_spacing == title_page.line_spacing
+            assert fmt.space_before.pt == 6
+            assert fmt.space_after.pt == 3
+            for run in paragraph.runs:
+                assert run.font.name == 'Arial'
+                assert run._r.rPr.rFonts.get(qn('w:cs')) == 'Arial'
+
+
+class TestTitleElements:
+    """Тесты разбора элементов титульного листа."""
+
+    def test_parse_elements_merges_items(self):
+        """Элементы-словари объединяются, пустые и некорректные пропускаются."""
+        elements = [{'title': 'Стандарт'}, None, {}, 'invalid', {'city': 'Москва'}]
+
+        result = TitleProcessor._parse_elements(elements)
+
+        assert result == {'title': 'Стандарт', 'city': 'Москва'}
@@ -370,6 +370,21 @@ class TestTOCPageNumbers:
         doc_text = "\n".join([p.text for p in doc.paragraphs])
         assert "ОГЛАВЛЕНИЕ" in doc_text
 
+    def test_page_number_follows_paragraph_position(self, base_config):
+        """Test that headings further in the document get later pages."""
+        processor = TOCProcessor(base_config)
+
+        doc = Document()
+        doc.add_paragraph("First", style='Heading 1')
+        for i in range(60):
+            doc.add_paragraph(f"Paragraph {i}")
+        doc.add_paragraph("Second", style='Heading 1')
+
+        headings = processor._extract_headings(doc)
+        entries = processor._build_toc_entries(doc, headings)
+
+        assert [entry['page_num'] for entry in entries] == [1, 2]
+
 
 # ============================================================================
 # TEST SUITE 6: Edge Cases and Error Handling
@@ -389,6 +404,17 @@ class TestTOCEdgeCases:
         assert doc is not None
         assert hasattr(doc, 'paragraphs')
     
+    def test_insert_into_document_without_paragraphs(self, toc_processor, empty_document):
+        """Test that the TOC title comes first when the document has no paragraphs."""
+        doc = empty_document
+        
+        toc_processor._insert_toc_to_document(doc, ["Section 1", "Section 2"])
+        
+        paragraphs = doc.paragraphs
+        title = toc_processor.config.structure.document_structure.toc.title
+        assert [p.text for p in paragraphs] == [title, "Section 1", "Section 2", ""]
+        assert paragraphs[0].style.name == 'Heading 1'
+    
     def test_document_without_headings(self, toc_processor, document_without_headings):
         """Test TOC creation on document with no headings."""
         doc = document_without_headings
@@ -1,14 +1,33 @@
 import logging
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
+from docx.styles import BabelFish
 from docx.shared import Pt, Cm, Mm, Inches
 from .models import DocumentFormattingError
 
 logger = logging.getLogger(__name__)
 
+# Размер буфера записи: zipfile пишет много мелких записей на каждую часть .docx
+SAVE_BUFFER_SIZE = 1 << 20
 
+# Коэффициенты перевода в пункты (1 дюйм = 72 pt = 25.4 мм)
+_MM_TO_PT = 72 / 25.4
+_CM_TO_PT = 72 / 2.54
+
+# Атрибуты w:rFonts, задающие семейство шрифта run
+_RFONTS_ATTRS = (qn('w:ascii'), qn('w:hAnsi'), qn('w:cs'))
+
+
+@lru_cache(maxsize=64, typed=True)
 def parse_measurement(value: str) -> object:
     """
     Парсинг размеров из строки (поддерживает mm, cm, pt, in).
 
+    Результаты кэшируются: одни и те же строки полей разбираются
+    для каждой секции документа, а объекты размеров неизменяемы.
+
     Args:
         value: Значение размера (строка или число).
 
@@ -37,8 +56,14 @@ def parse_measurement(value: str) -> object:
         raise DocumentFormattingError(f"Некорректный формат размера '{value}': {e}")
 
 
+@lru_cache(maxsize=64)
 def parse_size(size_str: str) -> float:
-    """Парсит строку с размером (поддерживает pt, px, mm) и возвращает в pt."""
+    """
+    Парсит строку с размером (поддерживает pt, px, mm, cm) и возвращает в pt.
+
+    Результат кэшируется: размеры основного шрифта и заголовков
+    обычно повторяются в конфигурации.
+    """
     size_str = size_str.lower().strip()
 
     if size_str.endswith('pt'):
@@ -46,7 +71,70 @@ def parse_size(size_str: str) -> float:
     elif size_str.endswith('px'):
         return float(size_str[:-2]) * 0.75  # Примерное преобразование px в pt
     elif size_str.endswith('mm'):
-        return Cm(float(size_str[:-2]) / 10).pt
+        return float(size_str[:-2]) * _MM_TO_PT
+    elif size_str.endswith('cm'):
+        return float(size_str[:-2]) * _CM_TO_PT
     else:
         # Если нет суффикса, считаем что это pt
         return float(size_str)
+
+
+def save_document(doc, output_path: str) -> None:
+    """
+    Сохраняет документ через буферизированный файл.
+
+    Args:
+        doc: Объект с методом save (Document, Composer).
+        output_path: Путь для сохранения файла.
+    """
+    with open(output_path, 'wb', buffering=SAVE_BUFFER_SIZE) as f:
+        doc.save(f)
+
+
+def set_run_fonts(r, family: str) -> None:
+    """
+    Устанавливает семейство шрифта элемента w:r через w:rFonts
+    (ascii, hAnsi и cs), чтобы Word не подставлял шрифт темы.
+
+    Работает напрямую с XML, без обёрток Run и Font python-docx.
+
+    Args:
+        r: Элемент w:r (CT_R).
+        family: Семейство шрифта.
+    """
+    rFonts = r.get_or_add_rPr().get_or_add_rFonts()
+    for attr in _RFONTS_ATTRS:
+        rFonts.set(attr, family)
+
+
+def paragraph_style_names(document) -> Tuple[Dict[str, Optional[str]], Optional[str]]:
+    """
+    Строит таблицу стилей абзацев документа: styleId -> имя стиля
+    (как style.name в python-docx), и возвращает имя стиля абзацев по умолчанию.
+
+    Абзац без w:pStyle или с неизвестным styleId получает стиль
+    по умолчанию — так же, как в paragraph.style, поэтому вызывающий код
+    ищет p.style в таблице с именем по умолчанию в качестве запасного значения.
+
+    Стили читаются из XML напрямую: StyleFactory python-docx не принимает
+    w:style без w:type, а по OOXML такой стиль является стилем абзаца.
+
+    Args:
+        document: Документ Word.
+
+    Returns:
+        Tuple[Dict[str, Optional[str]], Optional[str]]: Таблица имён стилей
+        и имя стиля абзацев по умолчанию (None, если его нет).
+    """
+    names = {}
+    default_name = None
+    for style_elm in document.styles.element.style_lst:
+        if style_elm.type not in (WD_STYLE_TYPE.PARAGRAPH, None):
+            continue
+        name_val = style_elm.name_val
+        name = BabelFish.internal2ui(name_val) if name_val is not None else None
+        names[style_elm.styleId] = name
+        # По спецификации действует последний стиль по умолчанию
+        if style_elm.default:
+            default_name = name
+    return names, default_name
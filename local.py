@@ -1,5 +1,12 @@
+import logging
+
 from doc_editor.editor import DocumentEditor
 
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(name)s - %(levelname)s - %(message)s'
+)
+
 
 editor = DocumentEditor("doc_editor/tests/test_data/test.docx")
 editor.load_config("doc_editor/tests/test_data/formatConfig.yaml")